@@ -1,5 +1,6 @@
 """Application bootstrap and dependency injection setup."""
 
+import shutil
 import sys
 
 from PySide6.QtWidgets import QApplication, QMessageBox
@@ -12,25 +13,42 @@ from audiobook_ripper.core.interfaces import (
     IMusicBrainzService,
     IRipper,
 )
-from audiobook_ripper.services.cd_drive import CDDriveService
-from audiobook_ripper.services.encoder import EncoderService
-from audiobook_ripper.services.metadata import MetadataService
-from audiobook_ripper.services.musicbrainz import MusicBrainzService
-from audiobook_ripper.services.ripper import FFmpegRipper
 from audiobook_ripper.ui.main_window import MainWindow
-from audiobook_ripper.utils.ffmpeg import check_ffmpeg
+from audiobook_ripper.utils.config import Config
+from audiobook_ripper.utils.ffmpeg import check_ffmpeg, get_ffmpeg_version
+
+
+def _metadata_factory():
+    from audiobook_ripper.services.metadata import MetadataService
+
+    return MetadataService()
+
+
+def _musicbrainz_factory():
+    from audiobook_ripper.services.musicbrainz import MusicBrainzService
+
+    return MusicBrainzService()
 
 
 def create_container() -> Container:
     """Create and configure the dependency injection container."""
+    # Service imports live here (and in the factories below) rather than at
+    # module level so that startup only pays for what it actually uses.
+    from audiobook_ripper.services.cd_drive import CDDriveService
+    from audiobook_ripper.services.ripper import FFmpegRipper
+    from audiobook_ripper.services.encoder import EncoderService
+
     container = Container()
 
     # Register services
     container.register(ICDDrive, CDDriveService())
     container.register(IRipper, FFmpegRipper())
     container.register(IEncoder, EncoderService())
-    container.register(IMetadataService, MetadataService())
-    container.register(IMusicBrainzService, MusicBrainzService())
+
+    # mutagen and musicbrainzngs are slow to import; defer them until the
+    # corresponding service is first resolved.
+    container.register_factory(IMetadataService, _metadata_factory)
+    container.register_factory(IMusicBrainzService, _musicbrainz_factory)
 
     return container
 
@@ -43,11 +61,26 @@ def check_prerequisites() -> list[str]:
     """
     errors = []
 
+    # A previous launch already verified FFmpeg; skip the subprocess probe
+    # as long as an ffmpeg binary is still on PATH. The which() lookup is
+    # cheap and catches an uninstall, in which case the cached version is
+    # stale and the full probe runs again.
+    config = Config.load()
+    if config.ffmpeg_version:
+        if shutil.which("ffmpeg"):
+            return errors
+        config.ffmpeg_version = ""
+        config.save()
+
     if not check_ffmpeg():
         errors.append(
             "FFmpeg is not installed or not in PATH.\n"
             "Please install FFmpeg and ensure it's accessible from the command line."
         )
+    else:
+        # Remember the working install so later launches start faster
+        config.ffmpeg_version = get_ffmpeg_version() or "unknown"
+        config.save()
 
     return errors
 
@@ -1,40 +1,52 @@
 """Dependency injection container."""
 
-from typing import Any, TypeVar
+from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
 
 class Container:
-    """Simple dependency injection container."""
+    """Simple dependency injection container.
+
+    Every registration is stored as a zero-arg provider; resolved
+    instances are memoized so the hot path is a single dict lookup.
+    """
 
     def __init__(self) -> None:
-        self._services: dict[type, Any] = {}
-        self._factories: dict[type, Any] = {}
+        self._providers: dict[type, Callable[[], Any]] = {}
+        self._cache: dict[type, Any] = {}
 
     def register(self, interface: type[T], implementation: T) -> None:
         """Register a singleton instance for an interface."""
-        self._services[interface] = implementation
+        self._providers[interface] = lambda impl=implementation: impl
+        self._cache.pop(interface, None)
 
-    def register_factory(self, interface: type[T], factory: Any) -> None:
+    def register_factory(self, interface: type[T], factory: Callable[[], T]) -> None:
         """Register a factory function for an interface."""
-        self._factories[interface] = factory
+        self._providers[interface] = factory
+        self._cache.pop(interface, None)
 
     def resolve(self, interface: type[T]) -> T:
         """Resolve an instance for the given interface."""
-        if interface in self._services:
-            return self._services[interface]
-        if interface in self._factories:
-            instance = self._factories[interface]()
-            self._services[interface] = instance
-            return instance
-        raise KeyError(f"No registration found for {interface.__name__}")
+        try:
+            return self._cache[interface]
+        except KeyError:
+            pass
+
+        try:
+            provider = self._providers[interface]
+        except KeyError:
+            raise KeyError(f"No registration found for {interface.__name__}") from None
+
+        instance = provider()
+        self._cache[interface] = instance
+        return instance
 
     def is_registered(self, interface: type) -> bool:
         """Check if an interface is registered."""
-        return interface in self._services or interface in self._factories
+        return interface in self._providers
 
     def clear(self) -> None:
         """Clear all registrations."""
-        self._services.clear()
-        self._factories.clear()
+        self._providers.clear()
+        self._cache.clear()
@@ -6,6 +6,7 @@ from typing import Callable, Protocol
 from audiobook_ripper.core.models import (
     AudiobookMetadata,
     DriveInfo,
+    EncodeJob,
     RipProgress,
     Track,
 )
@@ -26,8 +27,12 @@ class ICDDrive(Protocol):
         """Get the MusicBrainz disc ID for lookup."""
         ...
 
-    def eject(self, drive: str) -> None:
-        """Eject the disc from the specified drive."""
+    def eject(self, drive: str) -> int:
+        """Eject the disc from the specified drive.
+
+        Returns:
+            The MCI error code (0 on success)
+        """
         ...
 
 
@@ -53,7 +58,39 @@ class IRipper(Protocol):
         """Rip entire disc to a single WAV file."""
         ...
 
-    def get_chapters(self, drive: str) -> list[dict]:
+    def rip_and_encode(
+        self,
+        drive: str,
+        track_number: int,
+        output_path: Path,
+        bitrate: int = 192,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        """Rip a single track straight to MP3 without a WAV intermediate."""
+        ...
+
+    def rip_and_encode_disc(
+        self,
+        drive: str,
+        output_path: Path,
+        bitrate: int = 192,
+        total_duration: float | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        """Rip the whole disc straight into one MP3 without a WAV intermediate."""
+        ...
+
+    def rip_and_split(
+        self,
+        drive: str,
+        output_dir: Path,
+        chapters: list[dict],
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[Path]:
+        """Rip the disc straight into per-track WAVs in one pass."""
+        ...
+
+    def get_chapters(self, drive: str, disc_id: str | None = None) -> list[dict]:
         """Get chapter/track timing information from the disc."""
         ...
 
@@ -71,10 +108,20 @@ class IEncoder(Protocol):
         output_path: Path,
         bitrate: int = 192,
         progress_callback: Callable[[float], None] | None = None,
+        duration_seconds: float | None = None,
     ) -> None:
         """Encode a WAV file to MP3."""
         ...
 
+    def encode_many(
+        self,
+        jobs: list[EncodeJob],
+        max_workers: int | None = None,
+        job_callback: Callable[[EncodeJob, str | None], None] | None = None,
+    ) -> list[tuple[EncodeJob, str | None]]:
+        """Encode several WAV files to MP3 in parallel."""
+        ...
+
     def cancel(self) -> None:
         """Cancel the current encoding operation."""
         ...
@@ -4,20 +4,25 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveInfo:
     """Information about a CD drive."""
 
     letter: str
     name: str
     has_disc: bool = False
+    # Display string built once; __str__ runs on every UI refresh
+    _str: str = field(init=False, repr=False, compare=False, default="")
 
-    def __str__(self) -> str:
+    def __post_init__(self) -> None:
         status = "Ready" if self.has_disc else "Empty"
-        return f"{self.letter}: {self.name} ({status})"
+        self._str = f"{self.letter}: {self.name} ({status})"
+
+    def __str__(self) -> str:
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents a single CD track."""
 
@@ -25,16 +30,16 @@ class Track:
     duration_seconds: float
     title: str = ""
     artist: str = ""
+    # MM:SS display string, computed once at construction rather than on
+    # every track-list render
+    duration_formatted: str = field(init=False, repr=False, compare=False, default="")
 
-    @property
-    def duration_formatted(self) -> str:
-        """Return duration as MM:SS format."""
-        minutes = int(self.duration_seconds // 60)
-        seconds = int(self.duration_seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+    def __post_init__(self) -> None:
+        minutes, seconds = divmod(int(self.duration_seconds), 60)
+        self.duration_formatted = f"{minutes}:{seconds:02d}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudiobookMetadata:
     """Metadata for an audiobook track."""
 
@@ -61,16 +66,15 @@ class AudiobookMetadata:
     def to_id3_tags(self) -> dict[str, str]:
         """Convert to ID3 tag dictionary."""
         tags = {
-            "TIT2": self.title,
-            "TPE1": self.artist,
-            "TALB": self.album,
-            "TRCK": f"{self.track_number}/{self.total_tracks}" if self.total_tracks else str(self.track_number),
-            "TCON": self.genre,
+            key: str(value)
+            for key, attr in _ID3_TEXT_FIELDS
+            if (value := getattr(self, attr))
         }
-        if self.year:
-            tags["TDRC"] = str(self.year)
-        if self.narrator:
-            tags["TPE2"] = self.narrator  # Use album artist for narrator
+        if self.track_number:
+            if self.total_tracks:
+                tags["TRCK"] = f"{self.track_number}/{self.total_tracks}"
+            else:
+                tags["TRCK"] = str(self.track_number)
         if self.series:
             # Use grouping for series info
             series_info = self.series
@@ -85,7 +89,20 @@ class AudiobookMetadata:
         return tags
 
 
-@dataclass
+# Simple one-attribute ID3 text frames; composite frames (TRCK, TIT1,
+# TPOS) are assembled in to_id3_tags. TPE2 carries the narrator as
+# album artist.
+_ID3_TEXT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("TIT2", "title"),
+    ("TPE1", "artist"),
+    ("TALB", "album"),
+    ("TCON", "genre"),
+    ("TDRC", "year"),
+    ("TPE2", "narrator"),
+)
+
+
+@dataclass(slots=True)
 class RipProgress:
     """Progress information for a ripping operation."""
 
@@ -105,7 +122,19 @@ class RipProgress:
         return (completed + self.track_progress) / self.total_tracks
 
 
-@dataclass
+@dataclass(slots=True)
+class EncodeJob:
+    """A single WAV-to-MP3 encoding job."""
+
+    input_path: Path
+    output_path: Path
+    bitrate: int = 192
+    # Source duration when the caller already knows it (e.g. from the CD
+    # TOC); saves the encoder an ffprobe spawn per file
+    duration_seconds: float | None = None
+
+
+@dataclass(slots=True)
 class RipJob:
     """A job to rip tracks from a CD."""
 
@@ -114,3 +143,5 @@ class RipJob:
     output_dir: Path
     metadata: dict[int, AudiobookMetadata] = field(default_factory=dict)
     bitrate: int = 192
+    # Known per-track durations from the TOC, keyed by track number
+    track_durations: dict[int, float] = field(default_factory=dict)
@@ -1,10 +1,11 @@
-"""Business services for the audiobook ripper."""
+"""Business services for the audiobook ripper.
 
-from audiobook_ripper.services.cd_drive import CDDriveService
-from audiobook_ripper.services.ripper import FFmpegRipper
-from audiobook_ripper.services.encoder import EncoderService
-from audiobook_ripper.services.metadata import MetadataService
-from audiobook_ripper.services.musicbrainz import MusicBrainzService
+Service classes are loaded lazily on first attribute access so that
+importing this package does not pull in heavy dependencies (mutagen,
+musicbrainzngs) before they are actually needed.
+"""
+
+import importlib
 
 __all__ = [
     "CDDriveService",
@@ -13,3 +14,24 @@ __all__ = [
     "MetadataService",
     "MusicBrainzService",
 ]
+
+_lazy = {
+    "CDDriveService": ".cd_drive",
+    "EncoderService": ".encoder",
+    "FFmpegRipper": ".ripper",
+    "MetadataService": ".metadata",
+    "MusicBrainzService": ".musicbrainz",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy:
+        module = importlib.import_module(_lazy[name], __package__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,33 +1,110 @@
 """CD drive detection and information service."""
 
 import ctypes
-import json
 import string
-import subprocess
-from pathlib import Path
+import sys
+import time
 
 from audiobook_ripper.core.models import DriveInfo, Track
+from audiobook_ripper.services import ffprobe
+
+# Suppresses the system "No disk in drive" dialog while probing
+SEM_FAILCRITICALERRORS = 0x0001
+
+
+class _WinApi:
+    """WinAPI entry points bound once instead of per call.
+
+    `ctypes.windll.kernel32.X` walks a Python attribute chain on every
+    access; resolving the function pointers up front (with explicit
+    argtypes on Windows, so ctypes skips per-call marshalling autodetect)
+    keeps the drive-poll loop cheap.
+    """
+
+    def __init__(self) -> None:
+        kernel32 = ctypes.windll.kernel32
+        winmm = ctypes.windll.winmm
+
+        self.get_logical_drives = kernel32.GetLogicalDrives
+        self.get_drive_type = kernel32.GetDriveTypeW
+        self.get_volume_information = kernel32.GetVolumeInformationW
+        self.set_error_mode = kernel32.SetErrorMode
+        self.mci_send_string = winmm.mciSendStringW
+
+        if sys.platform == "win32":
+            from ctypes import wintypes
+
+            self.get_logical_drives.restype = wintypes.DWORD
+            self.get_drive_type.argtypes = [wintypes.LPCWSTR]
+            self.get_drive_type.restype = wintypes.UINT
+            self.get_volume_information.argtypes = [
+                wintypes.LPCWSTR,
+                wintypes.LPWSTR,
+                wintypes.DWORD,
+                ctypes.POINTER(wintypes.DWORD),
+                ctypes.POINTER(wintypes.DWORD),
+                ctypes.POINTER(wintypes.DWORD),
+                wintypes.LPWSTR,
+                wintypes.DWORD,
+            ]
+            self.set_error_mode.argtypes = [wintypes.UINT]
+            self.set_error_mode.restype = wintypes.UINT
+            self.mci_send_string.argtypes = [
+                wintypes.LPCWSTR,
+                wintypes.LPWSTR,
+                wintypes.UINT,
+                wintypes.HANDLE,
+            ]
+            self.mci_send_string.restype = wintypes.DWORD
 
 
 class CDDriveService:
     """Service for detecting and interacting with CD drives on Windows."""
 
-    def list_drives(self) -> list[DriveInfo]:
-        """List all available CD/DVD drives on the system."""
+    # How long cached disc-presence info stays valid. The UI polls drives
+    # frequently; probing a disc can spin it up and take seconds.
+    DISC_CACHE_TTL = 2.0
+
+    def __init__(self) -> None:
+        self._drive_type_cache: dict[str, int] = {}
+        self._disc_cache: dict[str, tuple[float, bool, str, int]] = {}
+        self._mci_alias: dict[str, str] = {}
+        self._toc_cache: dict[tuple[str, int], tuple[str | None, list[Track]]] = {}
+        self._api: _WinApi | None = None
+
+    def _winapi(self) -> _WinApi:
+        """Bind WinAPI function pointers on first use."""
+        if self._api is None:
+            self._api = _WinApi()
+        return self._api
+
+    def list_drives(self, letters: list[str] | None = None) -> list[DriveInfo]:
+        """List all available CD/DVD drives on the system.
+
+        Args:
+            letters: Optional drive letters to restrict the scan to, so a
+                device-change notification only re-probes the affected drive
+        """
         drives = []
+        api = self._winapi()
 
         # Get logical drives bitmask
-        bitmask = ctypes.windll.kernel32.GetLogicalDrives()
+        bitmask = api.get_logical_drives()
 
         for i, letter in enumerate(string.ascii_uppercase):
+            if letters is not None and letter not in letters:
+                continue
             if bitmask & (1 << i):
-                drive_path = f"{letter}:\\"
-                drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive_path)
+                # Drive types don't change for the process lifetime
+                drive_type = self._drive_type_cache.get(letter)
+                if drive_type is None:
+                    drive_path = f"{letter}:\\"
+                    drive_type = api.get_drive_type(drive_path)
+                    self._drive_type_cache[letter] = drive_type
 
                 # DRIVE_CDROM = 5
                 if drive_type == 5:
-                    has_disc = self._check_disc_present(letter)
-                    name = self._get_drive_name(letter)
+                    has_disc, name = self._probe_disc(letter)
                     drives.append(DriveInfo(
                         letter=letter,
                         name=name,
@@ -36,111 +113,169 @@ class CDDriveService:
 
         return drives
 
-    def _check_disc_present(self, drive: str) -> bool:
-        """Check if a disc is present in the drive."""
-        drive_path = Path(f"{drive}:\\")
-        try:
-            # Try to access the drive
-            return drive_path.exists() and any(drive_path.iterdir())
-        except (OSError, PermissionError):
-            return False
+    def _probe_disc(self, letter: str) -> tuple[bool, str]:
+        """Get (has_disc, name) for a drive, cached behind a short TTL."""
+        now = time.monotonic()
+        cached = self._disc_cache.get(letter)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+
+        has_disc, name, serial = self._probe_drive(letter)
+        if cached is not None and cached[3] != serial:
+            # The serial changed, so a different disc is loaded; the old
+            # TOC cached for this drive is stale
+            for key in [k for k in self._toc_cache if k[0] == letter]:
+                del self._toc_cache[key]
+        self._disc_cache[letter] = (now + self.DISC_CACHE_TTL, has_disc, name, serial)
+        return has_disc, name
+
+    def invalidate(self, letter: str | None = None) -> None:
+        """Drop cached disc info for one drive, or all drives."""
+        if letter is None:
+            self._disc_cache.clear()
+            self._toc_cache.clear()
+        else:
+            self._disc_cache.pop(letter, None)
+            for key in [k for k in self._toc_cache if k[0] == letter]:
+                del self._toc_cache[key]
 
-    def _get_drive_name(self, drive: str) -> str:
-        """Get the volume name or drive model."""
+    def _probe_drive(self, drive: str) -> tuple[bool, str, int]:
+        """Probe a drive with a single `GetVolumeInformationW` call.
+
+        A successful call means a readable disc is loaded, the volume
+        label doubles as the drive name, and the volume serial identifies
+        the disc — no directory listing (and no disc spin-up) required.
+        """
+        api = self._winapi()
         volume_name = ctypes.create_unicode_buffer(256)
-        ctypes.windll.kernel32.GetVolumeInformationW(
-            f"{drive}:\\",
-            volume_name,
-            256,
-            None,
-            None,
-            None,
-            None,
-            0,
-        )
+        serial = ctypes.c_ulong(0)
+
+        previous_mode = api.set_error_mode(SEM_FAILCRITICALERRORS)
+        try:
+            ok = api.get_volume_information(
+                f"{drive}:\\",
+                volume_name,
+                256,
+                ctypes.byref(serial),
+                None,
+                None,
+                None,
+                0,
+            )
+        finally:
+            api.set_error_mode(previous_mode)
+
         name = volume_name.value
-        return name if name else "CD/DVD Drive"
+        return bool(ok), name if name else "CD/DVD Drive", serial.value
 
     def get_tracks(self, drive: str) -> list[Track]:
         """Get track listing from a CD using discid library."""
+        return self._read_disc(drive)[1]
+
+    def _volume_serial(self, drive: str) -> int:
+        """Get the volume serial number of a drive (0 if unavailable).
+
+        Changing discs changes the serial, which keys the TOC cache. The
+        serial comes from the same `GetVolumeInformationW` probe as disc
+        presence, so polling shares one IOCTL per TTL window.
+        """
+        try:
+            cached = self._disc_cache.get(drive)
+            if cached is None or cached[0] <= time.monotonic():
+                self._probe_disc(drive)
+                cached = self._disc_cache.get(drive)
+            return cached[3] if cached is not None else 0
+        except Exception:
+            return 0
+
+    def _read_disc(self, drive: str) -> tuple[str | None, list[Track]]:
+        """Read the disc TOC once, caching by (drive, volume serial).
+
+        Both the disc ID and track listing come from the same discid
+        read, so polling get_tracks/get_disc_id back-to-back costs a
+        single TOC read per inserted disc.
+        """
+        key = (drive, self._volume_serial(drive))
+        cached = self._toc_cache.get(key)
+        if cached is not None:
+            return cached
+
+        disc_id: str | None = None
+        tracks: list[Track] = []
         try:
             import discid
             disc = discid.read(f"{drive}:")
-            tracks = []
+            disc_id = disc.id
             for i, track in enumerate(disc.tracks, start=1):
-                duration = track.seconds
                 tracks.append(Track(
                     number=i,
-                    duration_seconds=duration,
+                    duration_seconds=track.seconds,
                     title=f"Track {i:02d}",
                 ))
-            return tracks
         except Exception:
             # Fallback: try to detect tracks via FFmpeg
-            return self._get_tracks_ffmpeg(drive)
+            tracks = self._get_tracks_ffmpeg(drive)
+
+        self._toc_cache[key] = (disc_id, tracks)
+        return disc_id, tracks
 
     def _get_tracks_ffmpeg(self, drive: str) -> list[Track]:
         """Get track listing using FFmpeg as fallback."""
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "error",
-                    "-show_chapters",
-                    "-of", "json",
-                    "-f", "libcdio",
-                    "-i", f"{drive}:",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0 or not result.stdout.strip():
-                return []
-
-            data = json.loads(result.stdout)
-            chapters = data.get("chapters", [])
-
-            tracks = []
-            for chapter in chapters:
-                track_num = chapter.get("id", 0) + 1  # chapters are 0-indexed
-                start_time = float(chapter.get("start_time", 0))
-                end_time = float(chapter.get("end_time", 0))
-                duration = end_time - start_time
-                title = chapter.get("tags", {}).get("title", f"Track {track_num:02d}")
+        chapters = ffprobe.probe_disc(drive).chapters
 
-                tracks.append(Track(
-                    number=track_num,
-                    duration_seconds=duration,
-                    title=title,
-                ))
+        tracks = []
+        for chapter in chapters:
+            track_num = chapter.get("id", 0) + 1  # chapters are 0-indexed
+            start_time = float(chapter.get("start_time", 0))
+            end_time = float(chapter.get("end_time", 0))
+            duration = end_time - start_time
+            title = chapter.get("tags", {}).get("title", f"Track {track_num:02d}")
 
-            return tracks
+            tracks.append(Track(
+                number=track_num,
+                duration_seconds=duration,
+                title=title,
+            ))
 
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, subprocess.SubprocessError):
-            return []
+        return tracks
 
     def get_disc_id(self, drive: str) -> str | None:
         """Get the MusicBrainz disc ID for lookup."""
-        try:
-            import discid
-            disc = discid.read(f"{drive}:")
-            return disc.id
-        except Exception:
-            return None
+        return self._read_disc(drive)[0]
 
-    def eject(self, drive: str) -> None:
-        """Eject the disc from the specified drive."""
-        # Use Windows MCI command to eject
-        ctypes.windll.winmm.mciSendStringW(
-            f"open {drive}: type cdaudio alias cdrom",
-            None, 0, None
-        )
-        ctypes.windll.winmm.mciSendStringW(
-            "set cdrom door open",
-            None, 0, None
-        )
-        ctypes.windll.winmm.mciSendStringW(
-            "close cdrom",
+    def eject(self, drive: str) -> int:
+        """Eject the disc from the specified drive.
+
+        The MCI device is opened once per drive and kept open, so repeat
+        ejects cost a single winmm round-trip.
+
+        Returns:
+            The MCI error code (0 on success)
+        """
+        api = self._winapi()
+        alias = self._mci_alias.get(drive)
+        if alias is None:
+            alias = f"cd_{drive}"
+            api.mci_send_string(
+                f"open {drive}: type cdaudio alias {alias} shareable",
+                None, 0, None
+            )
+            self._mci_alias[drive] = alias
+
+        result = api.mci_send_string(
+            f"set {alias} door open",
             None, 0, None
         )
+        self.invalidate(drive)
+        return result
+
+    def close_all_aliases(self) -> None:
+        """Release any MCI aliases opened for ejecting."""
+        if self._mci_alias:
+            api = self._winapi()
+            for alias in self._mci_alias.values():
+                api.mci_send_string(
+                    f"close {alias}",
+                    None, 0, None
+                )
+            self._mci_alias.clear()
@@ -1,17 +1,27 @@
 """MP3 encoding service using FFmpeg."""
 
+import os
 import re
 import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable
 
+from audiobook_ripper.core.models import EncodeJob
+from audiobook_ripper.services import ffprobe
+
+# Compiled once; matching whole buffers in C beats per-line startswith
+# tests across the many keys FFmpeg writes to the progress pipe
+_OUT_TIME_MS = re.compile(rb"out_time_ms=(\d+)")
+
 
 class EncoderService:
     """Service for encoding audio files to MP3 using FFmpeg."""
 
     def __init__(self) -> None:
-        self._process: subprocess.Popen | None = None
+        self._processes: dict[int, subprocess.Popen] = {}
         self._cancelled = False
         self._lock = threading.Lock()
 
@@ -21,6 +31,7 @@ class EncoderService:
         output_path: Path,
         bitrate: int = 192,
         progress_callback: Callable[[float], None] | None = None,
+        duration_seconds: float | None = None,
     ) -> None:
         """Encode a WAV file to MP3.
 
@@ -29,6 +40,8 @@ class EncoderService:
             output_path: Path for output MP3 file
             bitrate: MP3 bitrate in kbps (default 192)
             progress_callback: Optional callback for progress updates (0.0-1.0)
+            duration_seconds: Input duration when already known (e.g. from
+                the CD TOC); skips the ffprobe spawn used to measure it
 
         Raises:
             FileNotFoundError: If input file doesn't exist
@@ -51,36 +64,56 @@ class EncoderService:
             str(output_path),
         ]
 
-        # Use local variable for process to support parallel encoding
+        # Use local variable for process to support parallel encoding.
+        # The progress pipe stays in binary mode - decoding thousands of
+        # key=value lines to str buys nothing.
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,  # Discard stderr to avoid deadlock
-            text=True,
+            bufsize=1 << 16,
         )
 
         # Track process for cancellation (but use local var for operations)
         with self._lock:
-            self._process = process
+            self._processes[id(process)] = process
 
         try:
-            total_duration = self._get_duration(input_path)
-
-            # Parse progress output
+            if duration_seconds is not None:
+                total_duration = duration_seconds
+            else:
+                total_duration = self._get_duration(input_path)
+
+            # Parse progress output in buffered chunks; one regex pass over
+            # a block of complete lines stays in C instead of looping over
+            # every key=value line in Python
             if process.stdout:
-                current_time = 0.0
-                for line in process.stdout:
-                    if self._cancelled:
+                clamp = min
+                read = process.stdout.read
+                finditer = _OUT_TIME_MS.finditer
+                report = progress_callback if total_duration > 0 else None
+                next_report = 0.0
+                buf = b""
+
+                while True:
+                    chunk = read(4096)
+                    if not chunk or self._cancelled:
                         break
 
-                    if line.startswith("out_time_ms="):
-                        try:
-                            ms = int(line.split("=")[1].strip())
-                            current_time = ms / 1_000_000  # Convert to seconds
-                            if total_duration > 0 and progress_callback:
-                                progress_callback(min(current_time / total_duration, 1.0))
-                        except ValueError:
-                            pass
+                    buf += chunk
+                    end = buf.rfind(b"\n")
+                    if end < 0:
+                        continue
+
+                    for match in finditer(buf, 0, end):
+                        # Throttle callbacks to ~10/s to keep the UI responsive
+                        now = time.monotonic()
+                        if report and now >= next_report:
+                            next_report = now + 0.1
+                            ms = int(match.group(1))
+                            report(clamp(ms / 1_000_000 / total_duration, 1.0))
+
+                    buf = buf[end + 1:]
 
             process.wait()
 
@@ -97,38 +130,83 @@ class EncoderService:
 
         finally:
             with self._lock:
-                if self._process is process:
-                    self._process = None
+                self._processes.pop(id(process), None)
 
-    def _get_duration(self, file_path: Path) -> float:
-        """Get the duration of an audio file in seconds."""
-        cmd = [
-            "ffprobe",
-            "-v", "quiet",
-            "-show_entries", "format=duration",
-            "-of", "csv=p=0",
-            str(file_path),
-        ]
+    def encode_many(
+        self,
+        jobs: list[EncodeJob],
+        max_workers: int | None = None,
+        job_callback: Callable[[EncodeJob, str | None], None] | None = None,
+    ) -> list[tuple[EncodeJob, str | None]]:
+        """Encode several WAV files to MP3 in parallel.
+
+        libmp3lame is single-threaded per stream, so concurrent ffmpeg
+        processes scale near-linearly; a few cores are reserved so the
+        UI and rip/metadata threads stay responsive while encoding.
 
+        Args:
+            jobs: Encoding jobs to run
+            max_workers: Thread pool size (default: cores minus three,
+                but at least 2 and no more than the number of jobs)
+            job_callback: Optional callback invoked as each job finishes,
+                with the job and an error string (None on success)
+
+        Returns:
+            List of (job, error) tuples; error is None on success
+        """
+        if max_workers is None:
+            # Leave headroom for the UI event loop and the rip/metadata
+            # worker threads so encoding can't starve them on small hosts
+            cores = os.cpu_count() or 1
+            max_workers = min(max(2, cores - 3), len(jobs)) or 1
+
+        results: list[tuple[EncodeJob, str | None]] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._run_job, job) for job in jobs]
+
+            for future in as_completed(futures):
+                if self._cancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+                job, error = future.result()
+                results.append((job, error))
+
+                if job_callback:
+                    job_callback(job, error)
+
+        return results
+
+    def _run_job(self, job: EncodeJob) -> tuple[EncodeJob, str | None]:
+        """Run a single encode job, capturing failures as strings."""
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-        except (subprocess.TimeoutExpired, ValueError):
-            pass
+            self.encode_to_mp3(
+                job.input_path,
+                job.output_path,
+                job.bitrate,
+                duration_seconds=job.duration_seconds,
+            )
+            return job, None
+        except Exception as e:
+            return job, str(e)
 
-        return 0.0
+    def _get_duration(self, file_path: Path) -> float:
+        """Get the duration of an audio file in seconds."""
+        return ffprobe.probe(file_path).duration
 
     def cancel(self) -> None:
-        """Cancel the current encoding operation."""
+        """Cancel all in-flight encoding operations."""
         self._cancelled = True
         with self._lock:
-            if self._process:
-                self._process.terminate()
-                try:
-                    self._process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self._process.kill()
+            processes = list(self._processes.values())
+
+        for process in processes:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
 
 
 def check_ffmpeg_available() -> bool:
@@ -0,0 +1,87 @@
+"""Shared ffprobe helper fetching duration and chapters in one call."""
+
+import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    # orjson parses ffprobe's JSON several times faster than the stdlib;
+    # it stays optional, so fall back silently when not installed
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+@dataclass
+class ProbeResult:
+    """Result of probing a media source."""
+
+    duration: float = 0.0
+    chapters: list[dict] = field(default_factory=list)
+
+
+def probe(path: Path) -> ProbeResult:
+    """Probe a media file for duration and chapters with one ffprobe call.
+
+    Results are cached keyed on (path, mtime, size) so re-probing an
+    unchanged file is free.
+
+    Args:
+        path: Path to the media file
+
+    Returns:
+        ProbeResult with duration and chapter list (empty on failure)
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return _run_probe(str(path))
+    return _cached_probe(str(path), stat.st_mtime, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _cached_probe(path: str, mtime: float, size: int) -> ProbeResult:
+    return _run_probe(path)
+
+
+def probe_disc(drive: str) -> ProbeResult:
+    """Probe an audio CD via FFmpeg's libcdio demuxer.
+
+    Args:
+        drive: Drive letter (e.g., 'D')
+
+    Returns:
+        ProbeResult with disc duration and per-track chapters
+    """
+    return _run_probe(f"{drive}:", fmt="libcdio")
+
+
+def _run_probe(source: str, fmt: str | None = None) -> ProbeResult:
+    """Run a single ffprobe over the source and parse its JSON output."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_format",
+        "-show_chapters",
+        "-of", "json",
+    ]
+    if fmt:
+        cmd += ["-f", fmt]
+    cmd += ["-i", source]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0 or not result.stdout.strip():
+            return ProbeResult()
+        data = loads(result.stdout)
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError, ValueError):
+        return ProbeResult()
+
+    duration = 0.0
+    try:
+        duration = float(data.get("format", {}).get("duration", 0))
+    except (TypeError, ValueError):
+        pass
+
+    return ProbeResult(duration=duration, chapters=data.get("chapters", []))
@@ -19,6 +19,19 @@ from mutagen.mp3 import MP3
 
 from audiobook_ripper.core.models import AudiobookMetadata
 
+# Frame classes for every text tag to_id3_tags can emit
+_TEXT_FRAME_TYPES = {
+    "TIT2": TIT2,
+    "TPE1": TPE1,
+    "TALB": TALB,
+    "TRCK": TRCK,
+    "TCON": TCON,
+    "TDRC": TDRC,
+    "TPE2": TPE2,
+    "TIT1": TIT1,
+    "TPOS": TPOS,
+}
+
 
 class MetadataService:
     """Service for reading and writing MP3 metadata using mutagen."""
@@ -118,7 +131,7 @@ class MetadataService:
         tags = audio.tags
 
         # Clear existing tags we'll be setting
-        for key in ["TIT2", "TPE1", "TALB", "TRCK", "TCON", "TDRC", "TPE2", "TIT1"]:
+        for key in _TEXT_FRAME_TYPES:
             if key in tags:
                 del tags[key]
 
@@ -127,48 +140,9 @@ class MetadataService:
         for key in keys_to_remove:
             del tags[key]
 
-        # Set standard tags
-        if metadata.title:
-            tags.add(TIT2(encoding=3, text=metadata.title))
-
-        if metadata.artist:
-            tags.add(TPE1(encoding=3, text=metadata.artist))
-
-        if metadata.album:
-            tags.add(TALB(encoding=3, text=metadata.album))
-
-        # Track number
-        if metadata.track_number:
-            if metadata.total_tracks:
-                track_str = f"{metadata.track_number}/{metadata.total_tracks}"
-            else:
-                track_str = str(metadata.track_number)
-            tags.add(TRCK(encoding=3, text=track_str))
-
-        if metadata.genre:
-            tags.add(TCON(encoding=3, text=metadata.genre))
-
-        if metadata.year:
-            tags.add(TDRC(encoding=3, text=str(metadata.year)))
-
-        # Audiobook-specific: narrator as album artist
-        if metadata.narrator:
-            tags.add(TPE2(encoding=3, text=metadata.narrator))
-
-        # Series info as grouping
-        if metadata.series:
-            series_info = metadata.series
-            if metadata.series_number:
-                series_info += f" #{metadata.series_number}"
-            tags.add(TIT1(encoding=3, text=series_info))
-
-        # Disc number
-        if metadata.disc_number:
-            if metadata.total_discs:
-                disc_str = f"{metadata.disc_number}/{metadata.total_discs}"
-            else:
-                disc_str = str(metadata.disc_number)
-            tags.add(TPOS(encoding=3, text=disc_str))
+        # Set text tags from the model's single source of truth
+        for key, text in metadata.to_id3_tags().items():
+            tags.add(_TEXT_FRAME_TYPES[key](encoding=3, text=text))
 
         # Cover art
         if metadata.cover_art:
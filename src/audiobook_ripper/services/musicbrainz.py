@@ -1,36 +1,150 @@
 """MusicBrainz lookup service for CD metadata."""
 
+import json
+import time
+from pathlib import Path
+
 import musicbrainzngs
 
 from audiobook_ripper.core.models import AudiobookMetadata, Track
 
+# MusicBrainz data is effectively immutable per disc ID, so hits are
+# cached forever; misses are retried after a day.
+NEGATIVE_CACHE_TTL = 86400.0
+
+# Text-search results shift as new releases are added; refresh monthly.
+SEARCH_CACHE_TTL = 30 * 86400.0
+
+# Sentinel distinguishing "not cached" from a cached None result.
+_MISSING = object()
+
+# Backoff schedule for retrying requests the server shed with a 503.
+_RETRY_DELAYS = (0.5, 1.0, 2.0)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a web-service error is a transient 503 overload."""
+    cause = getattr(error, "cause", None)
+    return getattr(cause, "code", None) == 503
+
+
+def _call_with_backoff(call):
+    """Run a MusicBrainz call, retrying 503 responses with backoff.
+
+    Anything other than a server-overload response propagates unchanged.
+    """
+    for delay in _RETRY_DELAYS:
+        try:
+            return call()
+        except musicbrainzngs.WebServiceError as e:
+            if not _is_retryable(e):
+                raise
+            time.sleep(delay)
+    return call()
+
 
 class MusicBrainzService:
     """Service for looking up CD metadata from MusicBrainz."""
 
-    def __init__(self, app_name: str = "AudiobookRipper", version: str = "0.1.0") -> None:
+    # Bound on the in-memory parsed-release memo
+    RELEASE_CACHE_SIZE = 128
+
+    def __init__(
+        self,
+        app_name: str = "AudiobookRipper",
+        version: str = "0.1.0",
+        cache_path: Path | None = None,
+    ) -> None:
         """Initialize the MusicBrainz service.
 
         Args:
             app_name: Application name for API identification
             version: Application version
+            cache_path: Override for the on-disk lookup cache location
         """
         musicbrainzngs.set_useragent(app_name, version)
+        # Be explicit about MusicBrainz etiquette: one request per second,
+        # no bursts. The on-disk caches keep real traffic well under this.
+        musicbrainzngs.set_rate_limit(1.0, 1)
+
+        if cache_path is None:
+            cache_path = Path.home() / ".audiobook-ripper" / "mb_cache.json"
+        self._cache_path = cache_path
+        self._cache = self._load_cache()
+        # Parsed releases keyed by MusicBrainz release ID, so re-parsing
+        # the same release (e.g. search then apply) is free
+        self._release_cache: dict[str, dict] = {}
+
+    def _load_cache(self) -> dict:
+        """Load the persistent disc-ID lookup cache."""
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
 
-    def lookup_by_disc_id(self, disc_id: str) -> dict | None:
+    def _save_cache(self) -> None:
+        """Persist the disc-ID lookup cache; failures are non-fatal."""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+        except OSError:
+            pass
+
+    def _cache_get(self, key: str, ttl: float | None = None):
+        """Return the cached result for a key, or _MISSING if absent/expired.
+
+        Cached None results (lookup misses) expire after NEGATIVE_CACHE_TTL;
+        anything else only expires when a ttl is given.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return _MISSING
+
+        result = entry.get("result")
+        age = time.time() - entry.get("timestamp", 0)
+        if result is None and age >= NEGATIVE_CACHE_TTL:
+            return _MISSING
+        if ttl is not None and age >= ttl:
+            return _MISSING
+        return result
+
+    def _cache_put(self, key: str, result) -> None:
+        """Store a result in the cache and persist it."""
+        self._cache[key] = {"timestamp": time.time(), "result": result}
+        self._save_cache()
+
+    def lookup_by_disc_id(self, disc_id: str, refresh: bool = False) -> dict | None:
         """Look up album information by MusicBrainz disc ID.
 
+        Results are cached on disk, so re-inserting a previously seen
+        disc never re-issues the web request.
+
         Args:
             disc_id: The disc ID from discid library
+            refresh: Bypass the cache and re-query MusicBrainz
 
         Returns:
             Dictionary with album/track info, or None if not found
         """
+        key = f"disc:{disc_id}"
+        if not refresh:
+            cached = self._cache_get(key)
+            if cached is not _MISSING:
+                return cached
+
+        result = self._lookup_remote(disc_id)
+        self._cache_put(key, result)
+        return result
+
+    def _lookup_remote(self, disc_id: str) -> dict | None:
+        """Query the MusicBrainz web service for a disc ID."""
         try:
-            result = musicbrainzngs.get_releases_by_discid(
+            result = _call_with_backoff(lambda: musicbrainzngs.get_releases_by_discid(
                 disc_id,
                 includes=["artists", "recordings", "release-groups"],
-            )
+            ))
 
             if "disc" not in result:
                 return None
@@ -50,7 +164,24 @@ class MusicBrainzService:
             return None
 
     def _parse_release(self, release: dict) -> dict:
-        """Parse a MusicBrainz release into our format."""
+        """Parse a MusicBrainz release into our format, memoized by ID."""
+        release_id = release.get("id")
+        if release_id is not None:
+            cached = self._release_cache.get(release_id)
+            if cached is not None:
+                return cached
+
+        parsed = self._parse_release_uncached(release)
+
+        if release_id is not None:
+            if len(self._release_cache) >= self.RELEASE_CACHE_SIZE:
+                self._release_cache.pop(next(iter(self._release_cache)))
+            self._release_cache[release_id] = parsed
+
+        return parsed
+
+    def _parse_release_uncached(self, release: dict) -> dict:
+        """Walk a raw MusicBrainz release dict into our format."""
         # Get artist
         artist = ""
         if "artist-credit" in release:
@@ -89,30 +220,45 @@ class MusicBrainzService:
             "release_id": release.get("id"),
         }
 
-    def search_release(self, query: str, limit: int = 10) -> list[dict]:
+    def search_release(self, query: str, limit: int = 10, refresh: bool = False) -> list[dict]:
         """Search for releases by text query.
 
+        Successful searches are cached on disk for SEARCH_CACHE_TTL, so
+        repeating a query skips the web request.
+
         Args:
             query: Search query (album title, artist, etc.)
             limit: Maximum number of results
+            refresh: Bypass the cache and re-query MusicBrainz
 
         Returns:
             List of matching releases
         """
+        key = f"search:{limit}:{query}"
+        if not refresh:
+            cached = self._cache_get(key, ttl=SEARCH_CACHE_TTL)
+            if cached is not _MISSING:
+                return cached
+
+        releases = self._search_remote(query, limit)
+        if releases is None:
+            # Transient web-service failure; don't poison the cache
+            return []
+
+        self._cache_put(key, releases)
+        return releases
+
+    def _search_remote(self, query: str, limit: int) -> list[dict] | None:
+        """Query the MusicBrainz search endpoint (None on failure)."""
         try:
-            result = musicbrainzngs.search_releases(
+            result = _call_with_backoff(lambda: musicbrainzngs.search_releases(
                 query,
                 limit=limit,
-            )
-
-            releases = []
-            for release in result.get("release-list", []):
-                releases.append(self._parse_release(release))
-
-            return releases
-
+            ))
         except musicbrainzngs.WebServiceError:
-            return []
+            return None
+
+        return [self._parse_release(release) for release in result.get("release-list", [])]
 
     def apply_to_tracks(
         self,
@@ -130,6 +276,8 @@ class MusicBrainzService:
         """
         metadata_map: dict[int, AudiobookMetadata] = {}
         release_tracks = release_info.get("tracks", [])
+        # Index release tracks once instead of scanning per CD track
+        by_number = {rt.get("number"): rt for rt in release_tracks}
 
         for track in tracks:
             metadata = AudiobookMetadata(
@@ -140,13 +288,8 @@ class MusicBrainzService:
                 total_tracks=len(tracks),
             )
 
-            # Find matching track info
-            for rt in release_tracks:
-                if rt.get("number") == track.number:
-                    metadata.title = rt.get("title", track.title)
-                    break
-            else:
-                metadata.title = track.title
+            rt = by_number.get(track.number)
+            metadata.title = rt.get("title", track.title) if rt else track.title
 
             metadata_map[track.number] = metadata
 
@@ -1,30 +1,123 @@
 """FFmpeg-based CD ripping service."""
 
 import json
+import os
 import re
 import subprocess
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
+from audiobook_ripper.services.ffprobe import loads
+
+# FFmpeg's -progress pipe emits deterministic key=value lines; scanning
+# buffered chunks with one compiled pattern replaces per-line regex
+# scraping of the human-readable stderr stats
+_OUT_TIME_MS = re.compile(rb"out_time_ms=(\d+)")
+
 
 class FFmpegRipper:
     """Service for ripping CD tracks using FFmpeg."""
 
-    def __init__(self) -> None:
+    # Bound on the in-memory chapter memo; sidecar files cover the rest
+    CHAPTER_CACHE_SIZE = 8
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
         self._process: subprocess.Popen | None = None
+        self._split_processes: dict[int, subprocess.Popen] = {}
         self._cancelled = False
         self._lock = threading.Lock()
-        self._chapter_cache: dict[str, list[dict]] = {}
+        self._chapter_cache: OrderedDict[str, list[dict]] = OrderedDict()
+        if cache_dir is None:
+            cache_dir = Path.home() / ".audiobook-ripper" / "chapters"
+        self._cache_dir = cache_dir
+
+    def _load_chapter_file(self, disc_id: str) -> list[dict] | None:
+        """Read persisted chapters for a disc ID (None if absent/corrupt)."""
+        try:
+            with open(self._cache_dir / f"{disc_id}.chapters.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
 
-    def _get_chapters(self, drive: str) -> list[dict]:
+    def _save_chapter_file(self, disc_id: str, chapters: list[dict]) -> None:
+        """Persist chapters for a disc ID; failures are non-fatal."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_dir / f"{disc_id}.chapters.json", "w", encoding="utf-8") as f:
+                json.dump(chapters, f)
+        except OSError:
+            pass
+
+    def _get_chapters(self, drive: str, disc_id: str | None = None) -> list[dict]:
         """Get chapter information from the CD.
 
+        Chapter layout belongs to the disc, not the drive, so when the
+        caller knows the disc ID a JSON sidecar in the cache dir is tried
+        before spawning ffprobe — it survives process restarts.
+
         Returns list of dicts with 'start_time' and 'end_time' for each track.
         """
-        if drive in self._chapter_cache:
-            return self._chapter_cache[drive]
+        cached = self._chapter_cache.get(drive)
+        if cached is not None:
+            self._chapter_cache.move_to_end(drive)
+            return cached
 
+        if disc_id:
+            cached = self._load_chapter_file(disc_id)
+            if cached is not None:
+                self._memo_chapters(drive, cached)
+                return cached
+
+        chapters = self._read_toc_discid(drive)
+        if chapters is None:
+            chapters = self._read_toc_ffprobe(drive)
+
+        if chapters:
+            self._memo_chapters(drive, chapters)
+            if disc_id:
+                self._save_chapter_file(disc_id, chapters)
+            return chapters
+
+        return []
+
+    def _memo_chapters(self, drive: str, chapters: list[dict]) -> None:
+        """Insert into the bounded chapter memo, evicting the oldest entry."""
+        self._chapter_cache[drive] = chapters
+        self._chapter_cache.move_to_end(drive)
+        while len(self._chapter_cache) > self.CHAPTER_CACHE_SIZE:
+            self._chapter_cache.popitem(last=False)
+
+    def _read_toc_discid(self, drive: str) -> list[dict] | None:
+        """Read chapter bounds in-process from the TOC via discid.
+
+        Audio CD chapter boundaries are the TOC, so a libdiscid read
+        replaces the ffprobe subprocess. Returns None when discid is
+        unavailable or the read fails, so ffprobe can take over.
+        """
+        try:
+            import discid
+            disc = discid.read(f"{drive}:")
+        except Exception:
+            return None
+
+        chapters = []
+        position = 0.0
+        for track in disc.tracks:
+            duration = track.sectors / 75.0  # CDDA: 75 sectors per second
+            chapters.append({
+                "start_time": position,
+                "end_time": position + duration,
+            })
+            position += duration
+
+        return chapters or None
+
+    def _read_toc_ffprobe(self, drive: str) -> list[dict]:
+        """Read chapter bounds by probing the disc with ffprobe."""
         cmd = [
             "ffprobe",
             "-v", "error",
@@ -37,26 +130,80 @@ class FFmpegRipper:
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                chapters = []
-                for chapter in data.get("chapters", []):
-                    chapters.append({
+                data = loads(result.stdout)
+                return [
+                    {
                         "start_time": float(chapter.get("start_time", 0)),
                         "end_time": float(chapter.get("end_time", 0)),
-                    })
-                self._chapter_cache[drive] = chapters
-                return chapters
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, ValueError):
+                    }
+                    for chapter in data.get("chapters", [])
+                ]
+        except (subprocess.TimeoutExpired, ValueError):
             pass
 
         return []
 
-    def get_chapters(self, drive: str) -> list[dict]:
+    def get_chapters(self, drive: str, disc_id: str | None = None) -> list[dict]:
         """Get chapter information from the CD (public interface).
 
         Returns list of dicts with 'start_time' and 'end_time' for each track.
         """
-        return self._get_chapters(drive)
+        return self._get_chapters(drive, disc_id)
+
+    def _watch_progress(
+        self,
+        process: subprocess.Popen,
+        total_duration: float,
+        progress_callback: Callable[[float], None] | None,
+    ) -> None:
+        """Follow a -progress pipe, reporting and stopping near the end.
+
+        Terminates the process once output reaches the disc duration;
+        libcdio keeps reading past the last track otherwise.
+        """
+        if not process.stdout:
+            return
+
+        buf = b""
+        read = process.stdout.read
+        finditer = _OUT_TIME_MS.finditer
+        last_emit = 0.0
+        last_progress = 0.0
+        # Work in integer microseconds on the hot path; one division
+        # happens per emitted callback, not per progress record
+        total_us = total_duration * 1_000_000
+        end_us = (total_duration - 1) * 1_000_000  # Within 1 second of end
+
+        while True:
+            chunk = read(4096)
+            if not chunk or self._cancelled:
+                break
+
+            buf += chunk
+            end = buf.rfind(b"\n")
+            if end < 0:
+                continue
+
+            # Only the newest record in the chunk matters
+            match = None
+            for match in finditer(buf, 0, end):
+                pass
+            buf = buf[end + 1:]
+
+            if match is not None:
+                current_us = int(match.group(1))
+                if progress_callback:
+                    # Coalesce callbacks: each one crosses the Qt thread
+                    # boundary, so only emit every 100 ms or whole percent
+                    progress = min(current_us / total_us, 0.99)
+                    now = time.monotonic()
+                    if now - last_emit > 0.1 or progress - last_progress > 0.01:
+                        last_emit = now
+                        last_progress = progress
+                        progress_callback(progress)
+                if current_us >= end_us:
+                    process.terminate()
+                    break
 
     def get_disc_duration(self, drive: str) -> float:
         """Get total disc duration in seconds."""
@@ -101,6 +248,8 @@ class FFmpegRipper:
             "-acodec", "pcm_s16le",
             "-ar", "44100",
             "-ac", "2",
+            "-progress", "pipe:1",
+            "-nostats",
             str(output_path),
         ]
 
@@ -108,38 +257,12 @@ class FFmpegRipper:
             with self._lock:
                 self._process = subprocess.Popen(
                     cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                    text=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=1 << 16,
                 )
 
-            # Parse FFmpeg's stderr to monitor progress
-            # FFmpeg outputs lines like: size=  756992KiB time=01:13:15.02 bitrate=...
-            current_time = 0.0
-
-            for line in self._process.stderr:
-                if self._cancelled:
-                    break
-
-                # Parse time from FFmpeg output
-                if "time=" in line:
-                    try:
-                        # Extract time=HH:MM:SS.ss
-                        time_match = re.search(r"time=(\d+):(\d+):(\d+\.?\d*)", line)
-                        if time_match:
-                            h, m, s = time_match.groups()
-                            current_time = int(h) * 3600 + int(m) * 60 + float(s)
-
-                            if progress_callback:
-                                progress = min(current_time / total_duration, 0.99)
-                                progress_callback(progress)
-
-                            # Check if we've reached the end
-                            if current_time >= total_duration - 1:  # Within 1 second of end
-                                self._process.terminate()
-                                break
-                    except (ValueError, AttributeError):
-                        pass
+            self._watch_progress(self._process, total_duration, progress_callback)
 
             # Wait for process to finish
             try:
@@ -187,57 +310,347 @@ class FFmpegRipper:
         """
         self._cancelled = False
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_paths: list[Path] = []
 
-        for i, chapter in enumerate(chapters):
+        if not chapters:
+            return []
+
+        # Contiguous chapters can all be cut by one ffmpeg segment-muxer
+        # run; non-contiguous selections need one ffmpeg per chapter.
+        if len(chapters) > 1 and self._chapters_contiguous(chapters):
+            return self._split_segments(output_dir, input_path, chapters, progress_callback)
+        return self._split_per_chapter(output_dir, input_path, chapters, progress_callback)
+
+    @staticmethod
+    def _chapters_contiguous(chapters: list[dict]) -> bool:
+        """Check whether each chapter starts where the previous one ends."""
+        return all(
+            abs(chapters[i]["start_time"] - chapters[i - 1]["end_time"]) < 0.05
+            for i in range(1, len(chapters))
+        )
+
+    def _split_segments(
+        self,
+        output_dir: Path,
+        input_path: Path,
+        chapters: list[dict],
+        progress_callback: Callable[[float], None] | None,
+    ) -> list[Path]:
+        """Split contiguous chapters with a single segment-muxer ffmpeg run.
+
+        One process spawn and one pass over the WAV, with a stream copy
+        instead of N decode/encode cycles. Leading audio before the first
+        chapter and anything after the last are cut into their own
+        segments and discarded.
+        """
+        total = len(chapters)
+        skip_leader = chapters[0]["start_time"] > 0
+        times = [chapter["start_time"] for chapter in chapters[1:]]
+        if skip_leader:
+            times.insert(0, chapters[0]["start_time"])
+        times.append(chapters[-1]["end_time"])
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i", str(input_path),
+            "-f", "segment",
+            "-segment_times", ",".join(str(t) for t in times),
+            "-reset_timestamps", "1",
+            "-map", "0:a",
+            "-c", "copy",
+            str(output_dir / "segment_%03d.wav"),
+        ]
+
+        try:
+            with self._lock:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+
+            _, stderr = self._process.communicate()
+
             if self._cancelled:
                 raise RuntimeError("Splitting cancelled")
 
-            output_path = output_dir / f"track_{i + 1:02d}.wav"
-            start_time = chapter["start_time"]
-            end_time = chapter["end_time"]
+            if self._process.returncode != 0:
+                raise RuntimeError(f"FFmpeg split failed: {stderr.decode() if stderr else 'Unknown error'}")
+
+        finally:
+            with self._lock:
+                self._process = None
+
+        produced = sorted(output_dir.glob("segment_*.wav"))
+        offset = 1 if skip_leader else 0
+        if len(produced) < offset + total:
+            raise RuntimeError("FFmpeg split failed: segment output missing")
+
+        output_paths: list[Path] = []
+        for i in range(total):
+            target = output_dir / f"track_{i + 1:02d}.wav"
+            produced[offset + i].replace(target)
+            output_paths.append(target)
+
+        for leftover in produced[:offset] + produced[offset + total:]:
+            leftover.unlink(missing_ok=True)
+
+        if progress_callback:
+            progress_callback(1.0)
+
+        return output_paths
+
+    def _split_per_chapter(
+        self,
+        output_dir: Path,
+        input_path: Path,
+        chapters: list[dict],
+        progress_callback: Callable[[float], None] | None,
+    ) -> list[Path]:
+        """Split chapters with one ffmpeg per chapter, run concurrently."""
+        # Chapter splits are independent reads of the same WAV, so run
+        # one ffmpeg per core instead of serializing them.
+        output_paths = [output_dir / f"track_{i + 1:02d}.wav" for i in range(len(chapters))]
+        total = len(chapters)
+        max_workers = min(os.cpu_count() or 1, total)
+        completed = 0
+        progress_lock = threading.Lock()
+
+        def split_one(index: int) -> None:
+            nonlocal completed
+
+            if self._cancelled:
+                raise RuntimeError("Splitting cancelled")
 
+            chapter = chapters[index]
+            output_path = output_paths[index]
             cmd = [
                 "ffmpeg",
                 "-y",
                 "-i", str(input_path),
-                "-ss", str(start_time),
-                "-to", str(end_time),
-                "-acodec", "pcm_s16le",
-                "-ar", "44100",
-                "-ac", "2",
+                "-ss", str(chapter["start_time"]),
+                "-to", str(chapter["end_time"]),
+                # Source is already PCM 44100/2ch; stream-copy the cut
+                "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
                 str(output_path),
             ]
 
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            with self._lock:
+                self._split_processes[id(process)] = process
+
             try:
+                _, stderr = process.communicate()
+            finally:
                 with self._lock:
-                    self._process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
+                    self._split_processes.pop(id(process), None)
+
+            if self._cancelled:
+                if output_path.exists():
+                    output_path.unlink()
+                raise RuntimeError("Splitting cancelled")
 
-                _, stderr = self._process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(f"FFmpeg split failed: {stderr.decode() if stderr else 'Unknown error'}")
 
-                if self._cancelled:
-                    if output_path.exists():
-                        output_path.unlink()
-                    raise RuntimeError("Splitting cancelled")
+            with progress_lock:
+                completed += 1
+                done = completed
+            if progress_callback:
+                progress_callback(done / total)
 
-                if self._process.returncode != 0:
-                    raise RuntimeError(f"FFmpeg split failed: {stderr.decode() if stderr else 'Unknown error'}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(split_one, i) for i in range(total)]
+            for future in futures:
+                future.result()
 
-                output_paths.append(output_path)
+        return output_paths
 
-                if progress_callback:
-                    progress_callback((i + 1) / len(chapters))
+    def rip_and_split(
+        self,
+        drive: str,
+        output_dir: Path,
+        chapters: list[dict],
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[Path]:
+        """Rip the disc straight into per-track WAVs in one ffmpeg pass.
 
-            finally:
-                with self._lock:
-                    self._process = None
+        Fuses rip_disc and split_audio: PCM flows from libcdio into the
+        segment muxer, so the full-disc WAV is never written to disk and
+        never read back. The drive is read sequentially either way, so
+        segmenting during the rip costs nothing.
+
+        Args:
+            drive: Drive letter (e.g., 'D')
+            output_dir: Directory for the per-track WAV files
+            chapters: All disc chapters, in order
+            progress_callback: Optional callback for progress updates (0.0-1.0)
+
+        Returns:
+            One WAV path per chapter, in track order
+
+        Raises:
+            RuntimeError: If ripping fails or is cancelled
+        """
+        self._cancelled = False
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if not chapters:
+            raise RuntimeError("Could not determine disc duration")
+
+        total_duration = chapters[-1]["end_time"]
+        if total_duration <= 0:
+            raise RuntimeError("Could not determine disc duration")
+
+        output_paths = [output_dir / f"track_{i + 1:02d}.wav" for i in range(len(chapters))]
+        times = [chapter["start_time"] for chapter in chapters[1:]]
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f", "libcdio",
+            "-i", f"{drive}:",
+            "-t", str(total_duration),  # Must specify duration for libcdio
+            "-map", "0:a:0",
+            "-acodec", "pcm_s16le",
+            "-ar", "44100",
+            "-ac", "2",
+            "-progress", "pipe:1",
+            "-nostats",
+        ]
+        if times:
+            cmd += [
+                "-f", "segment",
+                "-segment_times", ",".join(str(t) for t in times),
+                "-segment_start_number", "1",
+                "-reset_timestamps", "1",
+                str(output_dir / "track_%02d.wav"),
+            ]
+        else:
+            # Single-track disc: no interior boundaries to cut at
+            cmd.append(str(output_paths[0]))
+
+        try:
+            with self._lock:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=1 << 16,
+                )
+
+            self._watch_progress(self._process, total_duration, progress_callback)
+
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+            if self._cancelled:
+                for path in output_paths:
+                    if path.exists():
+                        path.unlink()
+                raise RuntimeError("Ripping cancelled")
+
+        finally:
+            with self._lock:
+                self._process = None
+
+        missing = [path for path in output_paths if not path.exists()]
+        if missing:
+            raise RuntimeError("Rip failed - output file not found")
+
+        if progress_callback:
+            progress_callback(1.0)
 
         return output_paths
 
+    def rip_and_encode_disc(
+        self,
+        drive: str,
+        output_path: Path,
+        bitrate: int = 192,
+        total_duration: float | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        """Rip the whole disc straight into one MP3 in a single ffmpeg pass.
+
+        Fuses rip_disc and encode_to_mp3: PCM flows from libcdio into
+        libmp3lame, so the ~700 MB full-disc WAV is never written to disk
+        or read back, and encoding overlaps the drive read.
+
+        Args:
+            drive: Drive letter (e.g., 'D')
+            output_path: Output file path for the MP3 file
+            bitrate: MP3 bitrate in kbps (default 192)
+            total_duration: Disc length in seconds (read from the TOC
+                when not supplied)
+            progress_callback: Optional callback for progress updates (0.0-1.0)
+
+        Raises:
+            RuntimeError: If ripping fails or is cancelled
+        """
+        self._cancelled = False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if total_duration is None:
+            chapters = self._get_chapters(drive)
+            total_duration = chapters[-1]["end_time"] if chapters else 0.0
+        if total_duration <= 0:
+            raise RuntimeError("Could not determine disc duration")
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f", "libcdio",
+            "-i", f"{drive}:",
+            "-t", str(total_duration),  # Must specify duration for libcdio
+            "-map", "0:a:0",
+            "-codec:a", "libmp3lame",
+            "-b:a", f"{bitrate}k",
+            "-progress", "pipe:1",
+            "-nostats",
+            str(output_path),
+        ]
+
+        try:
+            with self._lock:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=1 << 16,
+                )
+
+            self._watch_progress(self._process, total_duration, progress_callback)
+
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+            if self._cancelled:
+                if output_path.exists():
+                    output_path.unlink()
+                raise RuntimeError("Ripping cancelled")
+
+        finally:
+            with self._lock:
+                self._process = None
+
+        if not output_path.exists():
+            raise RuntimeError("Rip failed - output file not found")
+
+        if progress_callback:
+            progress_callback(1.0)
+
     def rip_track(
         self,
         drive: str,
@@ -278,9 +691,9 @@ class FFmpegRipper:
             "-ss", str(start_time),
             "-to", str(end_time),
             "-map", "0:a:0",
-            "-acodec", "pcm_s16le",
-            "-ar", "44100",
-            "-ac", "2",
+            # CDDA is already s16le 44100/2ch, so copying avoids a
+            # decode/re-encode pass that was a no-op anyway
+            "-c", "copy",
             str(output_path),
         ]
 
@@ -310,13 +723,111 @@ class FFmpegRipper:
             with self._lock:
                 self._process = None
 
+    def rip_and_encode(
+        self,
+        drive: str,
+        track_number: int,
+        output_path: Path,
+        bitrate: int = 192,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        """Rip a single track and encode it to MP3 in one FFmpeg process.
+
+        Skips the intermediate WAV entirely: PCM flows straight from
+        libcdio into libmp3lame, halving disk traffic per track.
+
+        Args:
+            drive: Drive letter (e.g., 'D')
+            track_number: Track number to rip (1-based)
+            output_path: Output file path for the MP3 file
+            bitrate: MP3 bitrate in kbps (default 192)
+            progress_callback: Optional callback for progress updates (0.0-1.0)
+
+        Raises:
+            RuntimeError: If ripping fails or is cancelled
+        """
+        self._cancelled = False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        chapters = self._get_chapters(drive)
+        if not chapters or track_number < 1 or track_number > len(chapters):
+            raise RuntimeError(f"Track {track_number} not found on disc")
+
+        chapter = chapters[track_number - 1]  # Convert to 0-based index
+        start_time = chapter["start_time"]
+        end_time = chapter["end_time"]
+        duration = end_time - start_time
+
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            "-f", "libcdio",
+            "-i", f"{drive}:",
+            "-ss", str(start_time),
+            "-to", str(end_time),
+            "-map", "0:a:0",
+            "-codec:a", "libmp3lame",
+            "-b:a", f"{bitrate}k",
+            "-progress", "pipe:1",
+            str(output_path),
+        ]
+
+        try:
+            with self._lock:
+                self._process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+
+            if self._process.stdout:
+                for line in self._process.stdout:
+                    if self._cancelled:
+                        break
+
+                    if not line.startswith("out_time_ms="):
+                        continue
+
+                    try:
+                        ms = int(line.partition("=")[2])
+                    except ValueError:
+                        continue
+
+                    if duration > 0 and progress_callback:
+                        progress_callback(min(ms / 1_000_000 / duration, 1.0))
+
+            self._process.wait()
+
+            if self._cancelled:
+                if output_path.exists():
+                    output_path.unlink()
+                raise RuntimeError("Ripping cancelled")
+
+            if self._process.returncode != 0:
+                raise RuntimeError("FFmpeg rip+encode failed")
+
+            if progress_callback:
+                progress_callback(1.0)
+
+        finally:
+            with self._lock:
+                self._process = None
+
     def cancel(self) -> None:
         """Cancel the current ripping operation."""
         self._cancelled = True
+        # Only take the lock to grab the process reference; waiting for
+        # FFmpeg to die can take seconds and must not block the worker
+        # thread that clears self._process.
         with self._lock:
+            processes = list(self._split_processes.values())
             if self._process:
-                self._process.terminate()
-                try:
-                    self._process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self._process.kill()
+                processes.append(self._process)
+
+        for process in processes:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
@@ -21,6 +21,7 @@ class DriveSelector(QWidget):
         super().__init__(parent)
         self._cd_drive_service = cd_drive_service
         self._drives: list[DriveInfo] = []
+        self._letter_to_index: dict[str, int] = {}
 
         self._setup_ui()
 
@@ -53,15 +54,22 @@ class DriveSelector(QWidget):
         self._combo.blockSignals(True)
         current_letter = self.current_drive()
 
-        self._drives = self._cd_drive_service.list_drives()
-        self._combo.clear()
+        # Sort so enumeration order from the OS can't look like a drive
+        # change; the tail emit below only fires on a real letter switch
+        self._drives = sorted(
+            self._cd_drive_service.list_drives(), key=lambda d: d.letter
+        )
+        self._letter_to_index = {d.letter: i for i, d in enumerate(self._drives)}
 
-        selected_index = -1
+        # One batched insert instead of a model notification per drive
+        self._combo.setUpdatesEnabled(False)
+        self._combo.clear()
+        self._combo.addItems([str(drive) for drive in self._drives])
         for i, drive in enumerate(self._drives):
-            self._combo.addItem(str(drive), drive.letter)
-            if drive.letter == current_letter:
-                selected_index = i
+            self._combo.setItemData(i, drive.letter)
+        self._combo.setUpdatesEnabled(True)
 
+        selected_index = self._letter_to_index.get(current_letter, -1)
         if selected_index >= 0:
             self._combo.setCurrentIndex(selected_index)
         elif self._drives:
@@ -69,9 +77,10 @@ class DriveSelector(QWidget):
 
         self._combo.blockSignals(False)
 
-        # Emit signal if selection changed
+        # Emit only on a real change; a refresh that lands on the same
+        # drive must not re-trigger a disc scan
         new_letter = self.current_drive()
-        if new_letter != current_letter:
+        if new_letter and new_letter != current_letter:
             self.drive_changed.emit(new_letter)
 
     def current_drive(self) -> str:
@@ -83,16 +92,19 @@ class DriveSelector(QWidget):
 
     def set_drive(self, letter: str) -> None:
         """Set the selected drive by letter."""
-        for i, drive in enumerate(self._drives):
-            if drive.letter == letter:
-                self._combo.setCurrentIndex(i)
-                break
+        index = self._letter_to_index.get(letter, -1)
+        if index >= 0:
+            self._combo.setCurrentIndex(index)
 
     def _on_selection_changed(self, index: int) -> None:
         if index >= 0 and index < len(self._drives):
             self.drive_changed.emit(self._drives[index].letter)
 
     def _on_refresh_clicked(self) -> None:
+        # An explicit refresh should bypass any cached disc state
+        invalidate = getattr(self._cd_drive_service, "invalidate", None)
+        if invalidate is not None:
+            invalidate()
         self.refresh()
         self.refresh_requested.emit()
 
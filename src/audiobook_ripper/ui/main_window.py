@@ -1,12 +1,18 @@
 """Main application window."""
 
-import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import ctypes
+import ctypes.wintypes
+import itertools
+import shutil
+import string
+import sys
+import time
 from pathlib import Path
-from threading import Lock
+from typing import Callable
 
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import QAbstractNativeEventFilter, QObject, Qt, QThread, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QDialog,
     QDialogButtonBox,
@@ -34,7 +40,7 @@ from audiobook_ripper.core.interfaces import (
     IMusicBrainzService,
     IRipper,
 )
-from audiobook_ripper.core.models import AudiobookMetadata, RipProgress, Track
+from audiobook_ripper.core.models import AudiobookMetadata, EncodeJob, RipProgress, Track
 from audiobook_ripper.ui.drive_selector import DriveSelector
 from audiobook_ripper.ui.metadata_editor import MetadataEditorDialog
 from audiobook_ripper.ui.progress_dialog import ProgressDialog
@@ -43,8 +49,70 @@ from audiobook_ripper.ui.track_list import TrackListWidget
 from audiobook_ripper.utils.config import Config
 
 
-class ScanWorker(QThread):
-    """Worker thread for scanning CD tracks."""
+# WM_DEVICECHANGE constants (winuser.h / dbt.h)
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+DBT_DEVTYP_VOLUME = 0x00000002
+
+# Strips characters Windows forbids in filenames in one C-level pass
+_SANITIZE_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
+
+def _safe_filename(title: str, track_num: int) -> str:
+    """Sanitize a track title for use as a filename stem."""
+    return title.translate(_SANITIZE_TABLE).strip() or f"Track {track_num:02d}"
+
+
+class _DevBroadcastVolume(ctypes.Structure):
+    """DEV_BROADCAST_VOLUME payload carried by WM_DEVICECHANGE."""
+
+    _fields_ = [
+        ("dbcv_size", ctypes.c_uint32),
+        ("dbcv_devicetype", ctypes.c_uint32),
+        ("dbcv_reserved", ctypes.c_uint32),
+        ("dbcv_unitmask", ctypes.c_uint32),
+        ("dbcv_flags", ctypes.c_uint16),
+    ]
+
+
+class DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Native event filter that reacts to disc insertion and removal.
+
+    Windows broadcasts WM_DEVICECHANGE when media arrives or leaves, so
+    drives only need re-probing when hardware actually changes instead of
+    on a polling timer.
+    """
+
+    def __init__(self, on_change: Callable[[str], None]) -> None:
+        super().__init__()
+        self._on_change = on_change
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type != b"windows_generic_MSG":
+            return False, 0
+
+        msg = ctypes.wintypes.MSG.from_address(int(message))
+        if msg.message != WM_DEVICECHANGE:
+            return False, 0
+
+        if msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE) and msg.lParam:
+            volume = _DevBroadcastVolume.from_address(msg.lParam)
+            if volume.dbcv_devicetype == DBT_DEVTYP_VOLUME:
+                mask = volume.dbcv_unitmask
+                for i, letter in enumerate(string.ascii_uppercase):
+                    if mask & (1 << i):
+                        self._on_change(letter)
+
+        return False, 0
+
+
+class ScanWorker(QObject):
+    """Worker that scans CD tracks on a dedicated QThread.
+
+    A plain QObject moved to its thread rather than a QThread subclass,
+    so the object's thread affinity matches where run() executes.
+    """
 
     finished = Signal(list)  # list of Track objects
     error = Signal(str)
@@ -54,6 +122,7 @@ class ScanWorker(QThread):
         self._cd_drive_service = cd_drive_service
         self._drive = drive
 
+    @Slot()
     def run(self) -> None:
         try:
             tracks = self._cd_drive_service.get_tracks(self._drive)
@@ -63,6 +132,14 @@ class ScanWorker(QThread):
             self.finished.emit([])
 
 
+# In-flight scan threads and their workers. Unlike a QThread subclass,
+# nothing in the running code references these objects, so they are
+# registered here — independent of any window — to keep garbage
+# collection from deleting a QThread that is still running. Finished
+# entries are reaped on the next refresh.
+_ACTIVE_SCANS: list[tuple[QThread, ScanWorker]] = []
+
+
 class ScanningDialog(QDialog):
     """Modal dialog shown while scanning a CD."""
 
@@ -151,7 +228,7 @@ class CombineOptionsDialog(QDialog):
         if not title:
             title = "audiobook"
         # Sanitize filename
-        safe_title = "".join(c for c in title if c not in '<>:"/\\|?*')
+        safe_title = title.translate(_SANITIZE_TABLE)
         disc = self._disc_spin.value()
         return f"{safe_title} - Disc {disc:02d}.mp3"
 
@@ -170,8 +247,8 @@ class CombineOptionsDialog(QDialog):
         return value if value > 0 else None
 
 
-class RipWorker(QThread):
-    """Worker thread for ripping and encoding tracks."""
+class RipWorker(QObject):
+    """Worker that rips and encodes tracks on a dedicated QThread."""
 
     progress = Signal(RipProgress)
     finished = Signal(bool)  # success
@@ -189,6 +266,8 @@ class RipWorker(QThread):
         bitrate: int,
         combine: bool = False,
         combined_filename: str = "audiobook.mp3",
+        track_durations: dict[int, float] | None = None,
+        disc_id: str | None = None,
     ) -> None:
         super().__init__()
         self._ripper = ripper
@@ -201,10 +280,21 @@ class RipWorker(QThread):
         self._bitrate = bitrate
         self._combine = combine
         self._combined_filename = combined_filename
+        self._track_durations = track_durations or {}
+        self._disc_id = disc_id
         self._cancelled = False
-
+        # Streaming progress is coalesced here and polled by the UI at
+        # ~30 Hz instead of being queued through a signal per update;
+        # step-boundary and error emits still use the progress signal
+        self._latest_progress: RipProgress | None = None
+        self._consumed_progress: RipProgress | None = None
+        self._last_stream_emit = 0.0
+
+    @Slot()
     def run(self) -> None:
         """Execute the ripping process using single-pass disc ripping."""
+        import tempfile  # deferred: only needed once a rip actually starts
+
         total_tracks = len(self._tracks)
         temp_dir = Path(tempfile.mkdtemp(prefix="audiobook_rip_"))
 
@@ -225,61 +315,40 @@ class RipWorker(QThread):
             self._cleanup_temp_dir(temp_dir)
 
     def _run_combined_mode(self, temp_dir: Path, total_tracks: int) -> None:
-        """Combined mode: rip disc → encode to single MP3 → write metadata."""
-        full_disc_wav = temp_dir / "full_disc.wav"
+        """Combined mode: rip disc straight to a single MP3 → write metadata."""
         combined_path = self._output_dir / self._combined_filename
 
-        # Step 1: Rip entire disc (progress 0-50%)
+        # Step 1: Rip and encode in one ffmpeg pass (progress 0-95%).
+        # PCM flows from the drive into the encoder, so no full-disc WAV
+        # is ever written or re-read.
         self.progress.emit(RipProgress(
             track_number=1,
             total_tracks=1,
             track_progress=0.0,
-            current_file=full_disc_wav,
-            status="Ripping entire disc",
-        ))
-
-        try:
-            self._ripper.rip_disc(
-                self._drive,
-                full_disc_wav,
-                lambda p: self._emit_progress(1, 1, p * 0.5, full_disc_wav, "Ripping disc"),
-            )
-        except Exception as e:
-            self.progress.emit(RipProgress(
-                track_number=1,
-                total_tracks=1,
-                track_progress=0.0,
-                status="Error",
-                error=f"Ripping failed: {e}",
-            ))
-            raise
-
-        if self._cancelled:
-            return
-
-        # Step 2: Encode to single MP3 (progress 50-95%)
-        self.progress.emit(RipProgress(
-            track_number=1,
-            total_tracks=1,
-            track_progress=0.5,
             current_file=combined_path,
-            status="Encoding",
+            status="Ripping and encoding disc",
         ))
 
         try:
-            self._encoder.encode_to_mp3(
-                full_disc_wav,
+            # The disc duration is the sum of the TOC durations, so the
+            # ripper doesn't need to re-probe the drive for it
+            disc_duration = sum(self._track_durations.values()) or None
+            self._ripper.rip_and_encode_disc(
+                self._drive,
                 combined_path,
                 self._bitrate,
-                lambda p: self._emit_progress(1, 1, 0.5 + p * 0.45, combined_path, "Encoding"),
+                total_duration=disc_duration,
+                progress_callback=lambda p: self._emit_progress(
+                    1, 1, p * 0.95, combined_path, "Ripping and encoding"
+                ),
             )
         except Exception as e:
             self.progress.emit(RipProgress(
                 track_number=1,
                 total_tracks=1,
-                track_progress=0.5,
+                track_progress=0.0,
                 status="Error",
-                error=f"Encoding failed: {e}",
+                error=f"Ripping failed: {e}",
             ))
             raise
 
@@ -319,24 +388,29 @@ class RipWorker(QThread):
         ))
 
     def _run_split_mode(self, temp_dir: Path, total_tracks: int) -> None:
-        """Split mode: rip disc → split by chapters → parallel encode → metadata."""
-        full_disc_wav = temp_dir / "full_disc.wav"
-
-        # Step 1: Rip entire disc (progress 0-40%)
+        """Split mode: rip disc straight to track WAVs → parallel encode → metadata."""
+        # Step 1: Rip the disc directly into per-track WAVs (progress 0-50%).
+        # One ffmpeg pass segments during the rip, so no full-disc WAV is
+        # ever written or re-read.
         self.progress.emit(RipProgress(
             track_number=1,
             total_tracks=total_tracks,
             track_progress=0.0,
-            current_file=full_disc_wav,
             status="Ripping entire disc",
         ))
 
         try:
-            self._ripper.rip_disc(
+            chapters = self._chapters_from_durations()
+            if not chapters:
+                chapters = self._ripper.get_chapters(self._drive, disc_id=self._disc_id)
+            all_wavs = self._ripper.rip_and_split(
                 self._drive,
-                full_disc_wav,
-                lambda p: self._emit_progress(1, total_tracks, p * 0.4, full_disc_wav, "Ripping disc"),
+                temp_dir,
+                chapters,
+                lambda p: self._emit_progress(1, total_tracks, p * 0.5, None, "Ripping disc"),
             )
+            # Keep only the WAVs for the selected tracks
+            track_wavs = [all_wavs[t - 1] for t in self._tracks if t <= len(all_wavs)]
         except Exception as e:
             self.progress.emit(RipProgress(
                 track_number=1,
@@ -350,152 +424,154 @@ class RipWorker(QThread):
         if self._cancelled:
             return
 
-        # Step 2: Get chapters and split into track WAVs (progress 40-50%)
-        self.progress.emit(RipProgress(
-            track_number=1,
-            total_tracks=total_tracks,
-            track_progress=0.4,
-            current_file=full_disc_wav,
-            status="Splitting tracks",
-        ))
+        # Sanitize each filename once; encode and metadata reuse the paths
+        mp3_paths = self._build_mp3_paths()
 
-        try:
-            chapters = self._ripper.get_chapters(self._drive)
-            # Filter chapters to only include selected tracks
-            selected_chapters = [chapters[t - 1] for t in self._tracks if t <= len(chapters)]
-
-            track_wavs = self._ripper.split_audio(
-                full_disc_wav,
-                temp_dir,
-                selected_chapters,
-                lambda p: self._emit_progress(1, total_tracks, 0.4 + p * 0.1, full_disc_wav, "Splitting"),
-            )
-        except Exception as e:
-            self.progress.emit(RipProgress(
-                track_number=1,
-                total_tracks=total_tracks,
-                track_progress=0.4,
-                status="Error",
-                error=f"Splitting failed: {e}",
-            ))
-            raise
+        # Step 2: Parallel encode all tracks (progress 50-95%)
+        encoded = self._parallel_encode(track_wavs, mp3_paths, total_tracks)
 
         if self._cancelled:
             return
 
-        # Clean up full disc WAV to save space
-        if full_disc_wav.exists():
-            full_disc_wav.unlink()
+        # Step 3: Write metadata to each successfully encoded MP3 (progress 95-100%)
+        self._write_all_metadata(encoded, total_tracks)
+
+    def _chapters_from_durations(self) -> list[dict]:
+        """Build chapter bounds from the durations captured at scan time.
+
+        Audio CD tracks are contiguous, so the TOC durations already read
+        during scanning fully determine the chapter boundaries — no
+        second TOC read is needed at rip time. Returns [] when the
+        durations are incomplete, letting the ripper fall back to its
+        own TOC read.
+        """
+        if not self._track_durations:
+            return []
+
+        numbers = sorted(self._track_durations)
+        if numbers != list(range(1, len(numbers) + 1)):
+            return []
+
+        chapters = []
+        position = 0.0
+        for number in numbers:
+            duration = self._track_durations[number]
+            if duration <= 0:
+                return []
+            chapters.append({"start_time": position, "end_time": position + duration})
+            position += duration
+
+        return chapters
+
+    def _build_mp3_paths(self) -> dict[int, Path]:
+        """Map each selected track number to its sanitized MP3 path."""
+        paths: dict[int, Path] = {}
+        for track_num in self._tracks:
+            meta = self._metadata.get(track_num, AudiobookMetadata(track_number=track_num))
+            safe_title = _safe_filename(meta.title, track_num)
+            paths[track_num] = self._output_dir / f"{track_num:02d} - {safe_title}.mp3"
+        return paths
 
-        # Step 3: Parallel encode all tracks (progress 50-95%)
-        self._parallel_encode(track_wavs, total_tracks)
+    def _parallel_encode(
+        self,
+        track_wavs: list[Path],
+        mp3_paths: dict[int, Path],
+        total_tracks: int,
+    ) -> dict[int, Path]:
+        """Encode tracks in parallel via the encoder's job pool.
+
+        Returns:
+            Track number to MP3 path for each successful encode
+        """
+        # itertools.count is atomic under the GIL, so no lock is needed
+        # around the completion counter
+        completed = itertools.count(1)
+
+        # Build one EncodeJob per selected track
+        jobs: list[EncodeJob] = []
+        for wav_path, track_num in zip(track_wavs, self._tracks):
+            mp3_path = mp3_paths[track_num]
+            jobs.append(EncodeJob(
+                input_path=wav_path,
+                output_path=mp3_path,
+                bitrate=self._bitrate,
+                duration_seconds=self._track_durations.get(track_num),
+            ))
 
-        if self._cancelled:
-            return
+        def on_job_done(job: EncodeJob, error: str | None) -> None:
+            if error is None:
+                # Drop each source WAV as soon as its MP3 exists, so peak
+                # temp-disk usage is one WAV per concurrent encoder, not
+                # the whole disc. Failed encodes keep theirs for retry.
+                job.input_path.unlink(missing_ok=True)
 
-        # Step 4: Write metadata to each MP3 (progress 95-100%)
-        self._write_all_metadata(total_tracks)
+            done = next(completed)
+            progress = 0.5 + (done / total_tracks) * 0.45
 
-    def _parallel_encode(self, track_wavs: list[Path], total_tracks: int) -> None:
-        """Encode tracks in parallel using ThreadPoolExecutor."""
-        completed_count = 0
-        completed_lock = Lock()
-        encode_errors: list[str] = []
+            self.progress.emit(RipProgress(
+                track_number=done,
+                total_tracks=total_tracks,
+                track_progress=progress,
+                current_file=job.output_path,
+                status="Error" if error else "Encoded",
+                error=error,
+            ))
 
-        def encode_track(args: tuple[int, Path, int]) -> tuple[int, Path, str | None]:
-            """Encode a single track. Returns (track_num, mp3_path, error)."""
-            idx, wav_path, track_num = args
+        results = self._encoder.encode_many(jobs, job_callback=on_job_done)
+
+        # The encoder already knows which jobs succeeded, so the metadata
+        # pass doesn't have to stat every output file
+        track_by_path = {mp3_paths[t]: t for t in self._tracks if t in mp3_paths}
+        encoded = {
+            track_by_path[job.output_path]: job.output_path
+            for job, error in results
+            if error is None and job.output_path in track_by_path
+        }
+
+        return encoded
+
+    def _write_all_metadata(self, encoded: dict[int, Path], total_tracks: int) -> None:
+        """Write metadata to the successfully encoded MP3 files in parallel.
+
+        Tagging is I/O-bound and each write opens its own file handle
+        (mutagen is safe across distinct File objects), so files tag
+        concurrently instead of waiting on each other's fsyncs. The
+        encode step reports which files it produced, so no per-file
+        exists() stat is needed here.
+        """
+        work: list[tuple[Path, AudiobookMetadata]] = []
+        for track_num, mp3_path in encoded.items():
             meta = self._metadata.get(track_num, AudiobookMetadata(track_number=track_num))
-            safe_title = "".join(c for c in meta.title if c not in '<>:"/\\|?*') or f"Track {track_num:02d}"
-            mp3_path = self._output_dir / f"{track_num:02d} - {safe_title}.mp3"
+            work.append((mp3_path, meta))
+
+        completed = itertools.count(1)
 
+        def write_one(mp3_path: Path, meta: AudiobookMetadata) -> None:
+            error = None
             try:
-                self._encoder.encode_to_mp3(
-                    wav_path,
-                    mp3_path,
-                    self._bitrate,
-                )
-                return (track_num, mp3_path, None)
+                self._metadata_service.write_metadata(mp3_path, meta)
             except Exception as e:
-                return (track_num, mp3_path, str(e))
-
-        # Create work items: (index, wav_path, track_number)
-        work_items = list(zip(range(len(track_wavs)), track_wavs, self._tracks))
-
-        # Use up to 4 threads for encoding (or fewer if less tracks)
-        max_workers = min(4, len(work_items))
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(encode_track, item): item for item in work_items}
-
-            for future in as_completed(futures):
-                if self._cancelled:
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    return
-
-                track_num, mp3_path, error = future.result()
-
-                with completed_lock:
-                    completed_count += 1
-                    progress = 0.5 + (completed_count / total_tracks) * 0.45
-
-                if error:
-                    encode_errors.append(f"Track {track_num}: {error}")
-                    self.progress.emit(RipProgress(
-                        track_number=completed_count,
-                        total_tracks=total_tracks,
-                        track_progress=progress,
-                        current_file=mp3_path,
-                        status="Error",
-                        error=error,
-                    ))
-                else:
-                    self.progress.emit(RipProgress(
-                        track_number=completed_count,
-                        total_tracks=total_tracks,
-                        track_progress=progress,
-                        current_file=mp3_path,
-                        status="Encoded",
-                    ))
-
-        # Clean up WAV files after encoding
-        for wav_path in track_wavs:
-            if wav_path.exists():
-                wav_path.unlink()
-
-    def _write_all_metadata(self, total_tracks: int) -> None:
-        """Write metadata to all encoded MP3 files."""
-        for i, track_num in enumerate(self._tracks, start=1):
-            if self._cancelled:
-                return
-
-            meta = self._metadata.get(track_num, AudiobookMetadata(track_number=track_num))
-            safe_title = "".join(c for c in meta.title if c not in '<>:"/\\|?*') or f"Track {track_num:02d}"
-            mp3_path = self._output_dir / f"{track_num:02d} - {safe_title}.mp3"
-
-            if not mp3_path.exists():
-                continue
+                error = f"Metadata write failed: {e}"
 
-            progress = 0.95 + (i / total_tracks) * 0.05
+            done = next(completed)
 
             self.progress.emit(RipProgress(
-                track_number=i,
+                track_number=done,
                 total_tracks=total_tracks,
-                track_progress=progress,
+                track_progress=0.95 + (done / total_tracks) * 0.05,
                 current_file=mp3_path,
-                status="Writing metadata",
+                status="Warning" if error else "Writing metadata",
+                error=error,
             ))
 
-            try:
-                self._metadata_service.write_metadata(mp3_path, meta)
-            except Exception as e:
-                self.progress.emit(RipProgress(
-                    track_number=i,
-                    total_tracks=total_tracks,
-                    track_progress=progress,
-                    status="Warning",
-                    error=f"Metadata write failed: {e}",
-                ))
+        if work and not self._cancelled:
+            from concurrent.futures import ThreadPoolExecutor
+
+            max_workers = min(4, len(work))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(write_one, path, meta) for path, meta in work]
+                for future in futures:
+                    future.result()
 
         self.progress.emit(RipProgress(
             track_number=total_tracks,
@@ -506,45 +582,9 @@ class RipWorker(QThread):
 
     def _cleanup_temp_dir(self, temp_dir: Path) -> None:
         """Clean up temporary directory and all its contents."""
-        try:
-            for f in temp_dir.iterdir():
-                f.unlink()
-            temp_dir.rmdir()
-        except OSError:
-            pass
-
-    def _combine_mp3_files(self, mp3_files: list[Path], output_path: Path) -> None:
-        """Combine multiple MP3 files into a single file using FFmpeg."""
-        import subprocess
-
-        # Create a file list for FFmpeg concat demuxer
-        list_file = mp3_files[0].parent / "concat_list.txt"
-        with open(list_file, "w", encoding="utf-8") as f:
-            for mp3 in mp3_files:
-                # Use forward slashes for FFmpeg compatibility on Windows
-                # and escape single quotes in filenames
-                path_str = str(mp3).replace("\\", "/").replace("'", "'\\''")
-                f.write(f"file '{path_str}'\n")
-
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(list_file),
-            "-c", "copy",
-            str(output_path),
-        ]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg concat failed: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("FFmpeg concat timed out after 10 minutes")
-        finally:
-            if list_file.exists():
-                list_file.unlink()
+        # rmtree recurses and never raises with ignore_errors, unlike the
+        # flat unlink loop this replaces, which choked on subdirectories
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
     def _emit_progress(
         self,
@@ -554,13 +594,37 @@ class RipWorker(QThread):
         path: Path,
         status: str,
     ) -> None:
-        self.progress.emit(RipProgress(
+        """Record streaming progress for the UI poll, throttled to ~30 Hz.
+
+        ffmpeg's progress pipe can report far faster than the UI can
+        usefully repaint. Publishing a snapshot for the UI timer to pick
+        up bounds UI-thread wakeups regardless of callback frequency;
+        the reference assignment is atomic under the GIL.
+        """
+        now = time.monotonic()
+        if now - self._last_stream_emit < 0.033 and progress < 1.0:
+            return
+        self._last_stream_emit = now
+
+        self._latest_progress = RipProgress(
             track_number=track_num,
             total_tracks=total,
             track_progress=progress,
             current_file=path,
             status=status,
-        ))
+        )
+
+    def take_latest_progress(self) -> RipProgress | None:
+        """Return the newest unseen streaming snapshot, or None.
+
+        Consumption is tracked by identity, so the UI poll never needs a
+        lock against the worker's writes.
+        """
+        latest = self._latest_progress
+        if latest is None or latest is self._consumed_progress:
+            return None
+        self._consumed_progress = latest
+        return latest
 
     def cancel(self) -> None:
         """Cancel the ripping operation."""
@@ -578,11 +642,65 @@ class MainWindow(QMainWindow):
         self._config = Config.load()
         self._tracks: list[Track] = []
         self._rip_worker: RipWorker | None = None
+        self._rip_thread: QThread | None = None
+        self._progress_dialog: ProgressDialog | None = None
+        self._last_rip_status: tuple[str | None, int | None] = (None, None)
+
+        # Debounces config writes from rapid UI changes; closeEvent
+        # dispatches a final save to the thread pool with a bounded wait
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(500)
+        self._config_save_timer.timeout.connect(self._save_config)
         self._scan_worker: ScanWorker | None = None
+        self._scan_thread: QThread | None = None
+        self._scanning_dialog: ScanningDialog | None = None
+        self._device_filter: DeviceChangeFilter | None = None
 
         self._setup_ui()
         self._connect_services()
         self._load_settings()
+        self._install_device_filter()
+        self._sweep_stale_temp_dirs()
+
+    def _sweep_stale_temp_dirs(self) -> None:
+        """Remove rip temp dirs left behind by crashed or killed runs.
+
+        A run that dies mid-rip can strand ~700 MB of PCM in the temp
+        directory. Sweep anything of ours older than a day on a pool
+        thread so startup isn't blocked on disk I/O.
+        """
+        def sweep() -> None:
+            import tempfile  # deferred off the startup path with the rest of the sweep
+
+            cutoff = time.time() - 86400
+            try:
+                for entry in Path(tempfile.gettempdir()).glob("audiobook_rip_*"):
+                    if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                        shutil.rmtree(entry, ignore_errors=True)
+            except OSError:
+                pass
+
+        QThreadPool.globalInstance().start(sweep)
+
+    def _install_device_filter(self) -> None:
+        """Refresh drives on WM_DEVICECHANGE instead of polling."""
+        if sys.platform != "win32":
+            return
+
+        self._device_filter = DeviceChangeFilter(self._on_device_change)
+        app = QApplication.instance()
+        if app is not None:
+            app.installNativeEventFilter(self._device_filter)
+
+    def _on_device_change(self, letter: str) -> None:
+        """Handle media arrival/removal for a single drive letter."""
+        if self._container.is_registered(ICDDrive):
+            cd_drive = self._container.resolve(ICDDrive)
+            invalidate = getattr(cd_drive, "invalidate", None)
+            if invalidate is not None:
+                invalidate(letter)
+        self._drive_selector.refresh()
 
     def _setup_ui(self) -> None:
         self.setWindowTitle("Audiobook CD Ripper")
@@ -708,8 +826,40 @@ class MainWindow(QMainWindow):
     def _on_drive_changed(self, drive: str) -> None:
         """Handle drive selection change."""
         self._config.last_drive = drive
+        self._prewarm_disc_caches(drive)
         self._refresh_tracks()
 
+    def _prewarm_disc_caches(self, drive: str) -> None:
+        """Speculatively warm the chapter and MusicBrainz caches.
+
+        Chapter probing spins up the drive and the MusicBrainz lookup is
+        an HTTPS round-trip — the two biggest serial waits later in the
+        pipeline. Kicking them off the moment a drive is selected lets
+        them overlap the track scan; only the cache side effects matter.
+        """
+        if not drive or not self._container.is_registered(ICDDrive):
+            return
+
+        cd_drive = self._container.resolve(ICDDrive)
+        ripper = None
+        if self._container.is_registered(IRipper):
+            ripper = self._container.resolve(IRipper)
+        mb_service = None
+        if self._config.auto_lookup and self._container.is_registered(IMusicBrainzService):
+            mb_service = self._container.resolve(IMusicBrainzService)
+
+        def warm() -> None:
+            try:
+                disc_id = cd_drive.get_disc_id(drive)
+                if ripper is not None:
+                    ripper.get_chapters(drive, disc_id)
+                if mb_service is not None and disc_id:
+                    mb_service.lookup_by_disc_id(disc_id)
+            except Exception:
+                pass  # Purely speculative; the foreground path retries
+
+        QThreadPool.globalInstance().start(warm)
+
     def _on_refresh(self) -> None:
         """Handle refresh button."""
         self._refresh_tracks()
@@ -729,36 +879,80 @@ class MainWindow(QMainWindow):
 
         cd_drive = self._container.resolve(ICDDrive)
 
+        # Join our own in-flight scan before starting over, then reap
+        # registry entries whose threads have finished
+        if self._scan_thread is not None and self._scan_thread.isRunning():
+            self._scan_thread.quit()
+            self._scan_thread.wait()
+        _ACTIVE_SCANS[:] = [entry for entry in _ACTIVE_SCANS if not entry[0].isFinished()]
+
         # Show scanning dialog
-        scanning_dialog = ScanningDialog(self)
+        self._scanning_dialog = ScanningDialog(self)
 
-        # Create worker
+        # Create worker on its own thread. The thread is deliberately
+        # unparented: the registry owns it, so tearing down the window
+        # mid-scan cannot destroy a running QThread.
         self._scan_worker = ScanWorker(cd_drive, drive)
+        self._scan_thread = QThread()
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+
+        # Bound slots on the window, so delivery is queued back to the
+        # UI thread (a plain closure would run on the worker thread)
+        self._scan_worker.finished.connect(self._on_scan_finished)
+        self._scan_worker.error.connect(self._on_scan_error)
+        # quit() is thread-safe; stopping the loop from the worker side
+        # ends the thread even if the UI loop is busy
+        self._scan_worker.finished.connect(
+            self._scan_thread.quit, Qt.ConnectionType.DirectConnection
+        )
 
-        def on_scan_finished(tracks: list[Track]) -> None:
-            scanning_dialog.accept()
-            self._tracks = tracks
-            self._track_list.set_tracks(self._tracks)
-            self._update_button_states()
+        _ACTIVE_SCANS.append((self._scan_thread, self._scan_worker))
 
-            if tracks:
-                self._status_bar.showMessage(f"Found {len(tracks)} tracks")
-                # Auto-lookup if enabled
-                if self._config.auto_lookup:
-                    self._on_lookup()
-            else:
-                self._status_bar.showMessage("No tracks found on disc")
+        # Join the thread when the window goes away so a scan can't
+        # outlive the UI it reports to (queued results to a destroyed
+        # window are discarded by Qt, but the drive keeps spinning)
+        scan_thread = self._scan_thread
 
-        def on_scan_error(error: str) -> None:
-            scanning_dialog.accept()
-            self._status_bar.showMessage(f"Error: {error}")
+        def join_scan_thread() -> None:
+            if scan_thread.isRunning():
+                scan_thread.quit()
+                scan_thread.wait()
 
-        self._scan_worker.finished.connect(on_scan_finished)
-        self._scan_worker.error.connect(on_scan_error)
+        self.destroyed.connect(join_scan_thread)
 
-        # Start worker and show dialog
-        self._scan_worker.start()
-        scanning_dialog.exec()
+        # Show the dialog non-modally: finished/error close it via the
+        # main event loop, so no nested exec() loop runs during the scan
+        # and the dialog can't leak if a handler raises
+        self._scan_thread.start()
+        self._scanning_dialog.show()
+
+    @Slot(list)
+    def _on_scan_finished(self, tracks: list[Track]) -> None:
+        """Consume scan results on the UI thread."""
+        if self._scanning_dialog is not None:
+            self._scanning_dialog.accept()
+            self._scanning_dialog = None
+
+        self._tracks = tracks
+        self._track_list.set_tracks(self._tracks)
+        self._update_button_states()
+
+        if tracks:
+            self._status_bar.showMessage(f"Found {len(tracks)} tracks")
+            # Auto-lookup if enabled
+            if self._config.auto_lookup:
+                self._on_lookup()
+        else:
+            self._status_bar.showMessage("No tracks found on disc")
+
+    @Slot(str)
+    def _on_scan_error(self, error: str) -> None:
+        """Report a scan failure on the UI thread."""
+        if self._scanning_dialog is not None:
+            self._scanning_dialog.accept()
+            self._scanning_dialog = None
+        self._status_bar.showMessage(f"Error: {error}")
 
     def _on_lookup(self) -> None:
         """Look up disc metadata from MusicBrainz."""
@@ -824,11 +1018,13 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             updates = dialog.get_batch_updates()
             if updates:
+                items = list(updates.items())
+                total = len(self._tracks)
                 for track_num in selected:
                     metadata = self._track_list.get_metadata(track_num) or AudiobookMetadata(track_number=track_num)
-                    for key, value in updates.items():
+                    for key, value in items:
                         setattr(metadata, key, value)
-                    metadata.total_tracks = len(self._tracks)
+                    metadata.total_tracks = total
                     self._track_list.set_metadata(track_num, metadata)
 
     def _on_browse_output(self) -> None:
@@ -841,7 +1037,7 @@ class MainWindow(QMainWindow):
         )
         if directory:
             self._config.output_directory = directory
-            self._config.save()
+            self._config_save_timer.start()
             self._output_label.setText(directory)
 
     def _on_settings(self) -> None:
@@ -915,6 +1111,12 @@ class MainWindow(QMainWindow):
         # Create progress dialog
         progress_dialog = ProgressDialog(len(selected), parent=self)
 
+        # Disc ID keys the persistent chapter cache; the TOC read behind
+        # it is already cached by the drive service
+        disc_id = None
+        if self._container.is_registered(ICDDrive):
+            disc_id = self._container.resolve(ICDDrive).get_disc_id(drive)
+
         # Create worker
         self._rip_worker = RipWorker(
             ripper=self._container.resolve(IRipper),
@@ -927,42 +1129,107 @@ class MainWindow(QMainWindow):
             bitrate=self._config.default_bitrate,
             combine=combine,
             combined_filename=combined_filename,
+            track_durations={t.number: t.duration_seconds for t in self._tracks},
+            disc_id=disc_id,
+        )
+        self._rip_thread = QThread(self)
+        self._rip_worker.moveToThread(self._rip_thread)
+        self._rip_thread.started.connect(self._rip_worker.run)
+        self._rip_worker.finished.connect(
+            self._rip_thread.quit, Qt.ConnectionType.DirectConnection
         )
 
-        # Connect signals
+        # Connect signals. The progress signal only carries step-boundary
+        # and error updates; streaming progress is polled below. Real
+        # @Slot methods, not lambdas: a closure per delivery on this hot
+        # path is allocation the dispatcher doesn't need to do.
+        self._progress_dialog = progress_dialog
+        self._last_rip_status = (None, None)
         self._rip_worker.progress.connect(progress_dialog.update_progress)
-        # Only log on status changes, not every progress tick
-        last_status = {"status": None, "track": None}
-        def log_status_change(p: RipProgress) -> None:
-            key = (p.status, p.track_number)
-            if key != (last_status["status"], last_status["track"]):
-                last_status["status"] = p.status
-                last_status["track"] = p.track_number
-                progress_dialog.log(f"{p.status}: Track {p.track_number}")
-        self._rip_worker.progress.connect(log_status_change)
-        self._rip_worker.finished.connect(lambda success: progress_dialog.set_finished(success))
-        self._rip_worker.error.connect(lambda e: progress_dialog.log(f"Error: {e}"))
-        progress_dialog.cancel_requested.connect(self._rip_worker.cancel)
+        self._rip_worker.progress.connect(self._log_status_change)
+        self._rip_worker.finished.connect(self._on_rip_finished)
+        self._rip_worker.error.connect(self._on_rip_error)
+        # Direct connection: the worker thread is busy inside run(), so a
+        # queued cancel would never be delivered until the rip finished
+        progress_dialog.cancel_requested.connect(
+            self._rip_worker.cancel, Qt.ConnectionType.DirectConnection
+        )
+
+        # Poll streaming progress at ~30 Hz so a fast ripper can't flood
+        # the UI event queue with per-update signal deliveries
+        worker = self._rip_worker
+
+        def poll_progress() -> None:
+            latest = worker.take_latest_progress()
+            if latest is not None:
+                progress_dialog.update_progress(latest)
+
+        poll_timer = QTimer(progress_dialog)
+        poll_timer.setInterval(33)
+        poll_timer.timeout.connect(poll_progress)
+        worker.finished.connect(poll_timer.stop)
+        poll_timer.start()
 
         # Start worker and show dialog
-        self._rip_worker.start()
+        self._rip_thread.start()
         progress_dialog.exec()
 
         # Clean up
-        if self._rip_worker.isRunning():
+        if self._rip_thread.isRunning():
             self._rip_worker.cancel()
-            self._rip_worker.wait()
+            self._rip_thread.quit()
+            self._rip_thread.wait()
         self._rip_worker = None
+        self._rip_thread = None
+        self._progress_dialog = None
+
+    @Slot(RipProgress)
+    def _log_status_change(self, progress: RipProgress) -> None:
+        """Log a line only when the rip status or track changes."""
+        key = (progress.status, progress.track_number)
+        if key != self._last_rip_status and self._progress_dialog is not None:
+            self._last_rip_status = key
+            self._progress_dialog.log(f"{progress.status}: Track {progress.track_number}")
+
+    @Slot(bool)
+    def _on_rip_finished(self, success: bool) -> None:
+        """Mark the progress dialog finished when the worker completes."""
+        if self._progress_dialog is not None:
+            self._progress_dialog.set_finished(success)
+
+    @Slot(str)
+    def _on_rip_error(self, error: str) -> None:
+        """Surface a worker error in the progress dialog log."""
+        if self._progress_dialog is not None:
+            self._progress_dialog.log(f"Error: {error}")
 
     def _update_status(self, selected: list[int]) -> None:
         """Update status bar with selection info."""
         checked = len(self._track_list.get_selected_tracks())
         self._status_bar.showMessage(f"{checked} tracks selected for ripping")
 
+    @Slot()
+    def _save_config(self) -> None:
+        """Write the config after the debounce window elapses."""
+        self._config.save()
+
     def closeEvent(self, event) -> None:
         """Handle window close."""
         # Save window size
         self._config.window_width = self.width()
         self._config.window_height = self.height()
-        self._config.save()
+        self._config_save_timer.stop()
+        # Write on the pool so teardown isn't blocked on disk; the
+        # bounded wait below keeps the data safe without stalling close
+        # indefinitely
+        QThreadPool.globalInstance().start(self._config.save)
+        QThreadPool.globalInstance().waitForDone(200)
+
+        # Release any MCI device aliases held for ejecting
+        if self._container.is_registered(ICDDrive):
+            cd_drive = self._container.resolve(ICDDrive)
+            close_aliases = getattr(cd_drive, "close_all_aliases", None)
+            if close_aliases is not None:
+                close_aliases()
+
         super().closeEvent(event)
@@ -1,9 +1,10 @@
 """Metadata editing dialog."""
 
-from pathlib import Path
+import hashlib
+import os.path
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QBuffer, QByteArray, QSize, Qt, QThreadPool, Signal, Slot
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -21,10 +22,28 @@ from PySide6.QtWidgets import (
 
 from audiobook_ripper.core.models import AudiobookMetadata
 
+# Suffix fallback for covers whose signature isn't recognized
+_SUFFIX_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+}
+
 
 class MetadataEditorDialog(QDialog):
     """Dialog for editing track metadata."""
 
+    # Covers larger than this on either side are re-encoded before being
+    # embedded; a 20 MB scan would otherwise be carried in memory and
+    # written into every tagged MP3
+    MAX_COVER_DIMENSION = 1000
+
+    # Internal: carries the decoded image and its cache key from the
+    # pool thread back to the GUI thread
+    _cover_decoded = Signal(QImage, object)
+
     def __init__(
         self,
         metadata: AudiobookMetadata,
@@ -43,6 +62,12 @@ class MetadataEditorDialog(QDialog):
         self._batch_mode = batch_mode
         self._cover_art_data: bytes | None = metadata.cover_art
         self._cover_art_mime: str = metadata.cover_art_mime
+        self._cover_key: str | None = None
+        # Identity fast path: reopening on the same bytes object skips
+        # even the hash of the data
+        self._last_preview_data: bytes | None = None
+        self._last_preview_pixmap: QPixmap | None = None
+        self._cover_decoded.connect(self._on_cover_decoded)
 
         self._setup_ui()
         self._load_metadata()
@@ -148,6 +173,17 @@ class MetadataEditorDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+        # Field getters for batch updates; empty/zero values mean "keep"
+        self._batch_field_accessors = (
+            ("album", self._album_edit.text),
+            ("artist", self._artist_edit.text),
+            ("genre", self._genre_edit.text),
+            ("narrator", self._narrator_edit.text),
+            ("series", self._series_edit.text),
+            ("series_number", self._series_number_edit.text),
+            ("year", self._year_spin.value),
+        )
+
     def _load_metadata(self) -> None:
         """Load metadata into the form fields."""
         self._title_edit.setText(self._metadata.title)
@@ -164,18 +200,66 @@ class MetadataEditorDialog(QDialog):
         self._update_cover_preview()
 
     def _update_cover_preview(self) -> None:
-        """Update the cover art preview."""
-        if self._cover_art_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self._cover_art_data)
-            scaled = pixmap.scaled(
-                150, 150,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self._cover_label.setPixmap(scaled)
-        else:
+        """Update the cover art preview.
+
+        Decoding and smooth-scaling large cover art blocks the GUI
+        thread, so both run on the global thread pool; only the cheap
+        QImage-to-QPixmap conversion happens back on this thread.
+        """
+        if not self._cover_art_data:
+            self._cover_key = None
+            self._last_preview_data = None
             self._cover_label.setText("No cover")
+            return
+
+        if (
+            self._cover_art_data is self._last_preview_data
+            and self._last_preview_pixmap is not None
+        ):
+            self._cover_label.setPixmap(self._last_preview_pixmap)
+            return
+
+        # QPixmapCache is global to the app, so 30 tracks sharing one
+        # album cover decode it exactly once between all editor dialogs
+        key = "cover:" + hashlib.blake2b(self._cover_art_data, digest_size=16).hexdigest()
+        self._cover_key = key
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            self._last_preview_data = self._cover_art_data
+            self._last_preview_pixmap = cached
+            self._cover_label.setPixmap(cached)
+            return
+
+        data = self._cover_art_data
+
+        def decode() -> None:
+            # Scale inside the decoder instead of decoding full
+            # resolution and throwing most of it away: for JPEG the
+            # decoder then only reads downscaled DCT coefficients
+            buffer = QBuffer(QByteArray(data))
+            reader = QImageReader(buffer)
+            source_size = reader.size()
+            if source_size.isValid():
+                reader.setScaledSize(
+                    source_size.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio)
+                )
+            else:
+                reader.setScaledSize(QSize(150, 150))
+            self._cover_decoded.emit(reader.read(), key)
+
+        QThreadPool.globalInstance().start(decode)
+
+    @Slot(QImage, object)
+    def _on_cover_decoded(self, image: QImage, key: str) -> None:
+        """Cache and display a preview decoded on the pool."""
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+
+        # Only show it if the cover hasn't changed again meanwhile
+        if key == self._cover_key:
+            self._last_preview_data = self._cover_art_data
+            self._last_preview_pixmap = pixmap
+            self._cover_label.setPixmap(pixmap)
 
     def _on_load_cover(self) -> None:
         """Load cover art from file."""
@@ -186,21 +270,56 @@ class MetadataEditorDialog(QDialog):
             "Images (*.jpg *.jpeg *.png *.gif *.bmp)",
         )
         if file_path:
-            path = Path(file_path)
-            self._cover_art_data = path.read_bytes()
-
-            # Determine MIME type
-            suffix = path.suffix.lower()
-            mime_map = {
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-                ".gif": "image/gif",
-                ".bmp": "image/bmp",
-            }
-            self._cover_art_mime = mime_map.get(suffix, "image/jpeg")
+            # Sniff the MIME type from the file signature without
+            # reading the whole image; the suffix is only a fallback
+            # since a misnamed file would be tagged wrong
+            with open(file_path, "rb") as f:
+                head = f.read(12)
+            if head.startswith(b"\xff\xd8\xff"):
+                mime = "image/jpeg"
+            elif head.startswith(b"\x89PNG\r\n\x1a\n"):
+                mime = "image/png"
+            elif head.startswith(b"GIF8"):
+                mime = "image/gif"
+            elif head.startswith(b"BM"):
+                mime = "image/bmp"
+            else:
+                suffix = os.path.splitext(file_path)[1].lower()
+                mime = _SUFFIX_MIME.get(suffix, "image/jpeg")
+
+            data, mime = self._load_cover_bytes(file_path, mime)
+            self._cover_art_data = data
+            self._cover_art_mime = mime
             self._update_cover_preview()
 
+    @staticmethod
+    def _load_cover_bytes(path: str, mime: str) -> tuple[bytes | None, str]:
+        """Read cover bytes, downscaling oversized images to JPEG.
+
+        The reader decodes straight from the file, so the original is
+        never held in memory when a re-encode is needed.
+        """
+        reader = QImageReader(path)
+        size = reader.size()
+        limit = MetadataEditorDialog.MAX_COVER_DIMENSION
+        if size.isValid() and max(size.width(), size.height()) <= limit:
+            with open(path, "rb") as f:
+                return f.read(), mime
+
+        if size.isValid():
+            reader.setScaledSize(size.scaled(limit, limit, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            # Unreadable as an image; embed the raw bytes unchanged
+            with open(path, "rb") as f:
+                return f.read(), mime
+
+        buffer = QBuffer()
+        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+        image.save(buffer, "JPEG", 90)
+        buffer.close()
+        return bytes(buffer.data()), "image/jpeg"
+
     def _on_clear_cover(self) -> None:
         """Clear the cover art."""
         self._cover_art_data = None
@@ -228,22 +347,11 @@ class MetadataEditorDialog(QDialog):
 
         Returns fields that have non-empty values.
         """
-        updates: dict[str, str | int | bytes | None] = {}
-
-        if self._album_edit.text():
-            updates["album"] = self._album_edit.text()
-        if self._artist_edit.text():
-            updates["artist"] = self._artist_edit.text()
-        if self._genre_edit.text():
-            updates["genre"] = self._genre_edit.text()
-        if self._narrator_edit.text():
-            updates["narrator"] = self._narrator_edit.text()
-        if self._series_edit.text():
-            updates["series"] = self._series_edit.text()
-        if self._series_number_edit.text():
-            updates["series_number"] = self._series_number_edit.text()
-        if self._year_spin.value():
-            updates["year"] = self._year_spin.value()
+        updates: dict[str, str | int | bytes | None] = {
+            name: value
+            for name, getter in self._batch_field_accessors
+            if (value := getter())
+        }
         if self._cover_art_data:
             updates["cover_art"] = self._cover_art_data
             updates["cover_art_mime"] = self._cover_art_mime
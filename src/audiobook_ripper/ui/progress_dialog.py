@@ -1,6 +1,7 @@
 """Progress dialog for ripping operations."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -25,6 +26,22 @@ class ProgressDialog(QDialog):
         self._total_tracks = total_tracks
         self._cancelled = False
 
+        # Log lines are coalesced: each QTextEdit.append() reflows the
+        # document, so bursty worker logging is buffered and flushed in
+        # one append per timer window
+        # Last values pushed into the widgets; setValue/setText trigger
+        # repaints even when nothing changed, so unchanged updates are
+        # skipped outright
+        self._last_pct = -1
+        self._last_current_text = ""
+        self._last_status_text = ""
+
+        self._pending_log: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_log)
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -78,32 +95,54 @@ class ProgressDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    @Slot(RipProgress)
     def update_progress(self, progress: RipProgress) -> None:
         """Update the dialog with new progress information."""
         # Update labels
-        self._current_label.setText(
+        current_text = (
             f"Track {progress.track_number} of {progress.total_tracks}: {progress.status}"
         )
+        if current_text != self._last_current_text:
+            self._last_current_text = current_text
+            self._current_label.setText(current_text)
 
         if progress.current_file:
-            self._status_label.setText(f"Output: {progress.current_file.name}")
+            status_text = f"Output: {progress.current_file.name}"
+            if status_text != self._last_status_text:
+                self._last_status_text = status_text
+                self._status_label.setText(status_text)
 
         # Update progress bar
-        self._overall_progress.setValue(int(progress.overall_progress * 100))
+        pct = int(progress.overall_progress * 100)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._overall_progress.setValue(pct)
 
         # Log errors
         if progress.error:
             self.log(f"Error: {progress.error}")
 
     def log(self, message: str) -> None:
-        """Add a message to the log output."""
-        self._log_text.append(message)
-        # Scroll to bottom
-        scrollbar = self._log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """Add a message to the log output (flushed on a short timer)."""
+        self._pending_log.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush_log(self) -> None:
+        """Append all buffered log lines in a single document reflow."""
+        if not self._pending_log:
+            return
+        self._log_text.append("\n".join(self._pending_log))
+        self._pending_log.clear()
+        # Scroll to bottom; moving the cursor skips the extra scrollbar
+        # recalculation a setValue(maximum()) would do
+        self._log_text.moveCursor(QTextCursor.MoveOperation.End)
 
     def set_finished(self, success: bool = True) -> None:
         """Mark the operation as finished."""
+        self._flush_timer.stop()
+        self._flush_log()
         self._cancel_btn.setEnabled(False)
         self._close_btn.setEnabled(True)
 
@@ -122,6 +161,7 @@ class ProgressDialog(QDialog):
         """Check if cancellation was requested."""
         return self._cancelled
 
+    @Slot()
     def _on_cancel(self) -> None:
         self._cancelled = True
         self._cancel_btn.setEnabled(False)
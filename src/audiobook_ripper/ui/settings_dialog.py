@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -9,17 +10,24 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
-    QGroupBox,
     QHBoxLayout,
     QLineEdit,
     QPushButton,
-    QSpinBox,
+    QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
 from audiobook_ripper.utils.config import Config
 
+_BITRATES = ("128", "160", "192", "224", "256", "320")
+_HOME_STR = str(Path.home())
+
+# Tab indices; the Output tab is built eagerly, the rest on first view
+_TAB_OUTPUT = 0
+_TAB_METADATA = 1
+_TAB_MUSICBRAINZ = 2
+
 
 class SettingsDialog(QDialog):
     """Dialog for editing application settings."""
@@ -37,9 +45,13 @@ class SettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Output settings
-        output_group = QGroupBox("Output Settings")
-        output_layout = QFormLayout(output_group)
+        # Tabs are built lazily: opening the dialog only pays for the
+        # widgets of the visible tab
+        self._tabs = QTabWidget()
+        self._built_tabs: set[int] = {_TAB_OUTPUT}
+
+        output_page = QWidget()
+        output_layout = QFormLayout(output_page)
 
         # Output directory
         dir_layout = QHBoxLayout()
@@ -52,7 +64,7 @@ class SettingsDialog(QDialog):
 
         # Bitrate
         self._bitrate_combo = QComboBox()
-        self._bitrate_combo.addItems(["128", "160", "192", "224", "256", "320"])
+        self._bitrate_combo.addItems(_BITRATES)
         output_layout.addRow("MP3 Bitrate (kbps):", self._bitrate_combo)
 
         # Filename template
@@ -60,31 +72,11 @@ class SettingsDialog(QDialog):
         self._filename_edit.setPlaceholderText("{track:02d} - {title}")
         output_layout.addRow("Filename Template:", self._filename_edit)
 
-        layout.addWidget(output_group)
-
-        # Metadata defaults
-        metadata_group = QGroupBox("Metadata Defaults")
-        metadata_layout = QFormLayout(metadata_group)
-
-        self._genre_edit = QLineEdit()
-        metadata_layout.addRow("Default Genre:", self._genre_edit)
-
-        self._artist_edit = QLineEdit()
-        metadata_layout.addRow("Default Author:", self._artist_edit)
-
-        self._narrator_edit = QLineEdit()
-        metadata_layout.addRow("Default Narrator:", self._narrator_edit)
-
-        layout.addWidget(metadata_group)
-
-        # MusicBrainz settings
-        mb_group = QGroupBox("MusicBrainz")
-        mb_layout = QFormLayout(mb_group)
-
-        self._auto_lookup_check = QCheckBox("Automatically look up disc info")
-        mb_layout.addRow(self._auto_lookup_check)
-
-        layout.addWidget(mb_group)
+        self._tabs.addTab(output_page, "Output")
+        self._tabs.addTab(QWidget(), "Metadata Defaults")
+        self._tabs.addTab(QWidget(), "MusicBrainz")
+        self._tabs.currentChanged.connect(self._build_tab)
+        layout.addWidget(self._tabs)
 
         # Dialog buttons
         button_box = QDialogButtonBox(
@@ -97,30 +89,64 @@ class SettingsDialog(QDialog):
         button_box.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._on_apply)
         layout.addWidget(button_box)
 
+    @Slot(int)
+    def _build_tab(self, index: int) -> None:
+        """Construct a tab's widget tree on first view."""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        page = self._tabs.widget(index)
+
+        if index == _TAB_METADATA:
+            metadata_layout = QFormLayout(page)
+
+            self._genre_edit = QLineEdit()
+            metadata_layout.addRow("Default Genre:", self._genre_edit)
+
+            self._artist_edit = QLineEdit()
+            metadata_layout.addRow("Default Author:", self._artist_edit)
+
+            self._narrator_edit = QLineEdit()
+            metadata_layout.addRow("Default Narrator:", self._narrator_edit)
+
+            self._genre_edit.setText(self._config.default_genre)
+            self._artist_edit.setText(self._config.default_artist)
+            self._narrator_edit.setText(self._config.default_narrator)
+
+        elif index == _TAB_MUSICBRAINZ:
+            mb_layout = QFormLayout(page)
+
+            self._auto_lookup_check = QCheckBox("Automatically look up disc info")
+            mb_layout.addRow(self._auto_lookup_check)
+
+            self._auto_lookup_check.setChecked(self._config.auto_lookup)
+
     def _load_config(self) -> None:
         """Load current config into form fields."""
         self._output_dir_edit.setText(self._config.output_directory)
         self._bitrate_combo.setCurrentText(str(self._config.default_bitrate))
         self._filename_edit.setText(self._config.filename_template)
-        self._genre_edit.setText(self._config.default_genre)
-        self._artist_edit.setText(self._config.default_artist)
-        self._narrator_edit.setText(self._config.default_narrator)
-        self._auto_lookup_check.setChecked(self._config.auto_lookup)
 
     def _save_config(self) -> None:
-        """Save form values to config."""
+        """Save form values to config.
+
+        Unbuilt tabs never diverged from the config, so only the fields
+        whose widgets exist are read back.
+        """
         self._config.output_directory = self._output_dir_edit.text()
         self._config.default_bitrate = int(self._bitrate_combo.currentText())
         self._config.filename_template = self._filename_edit.text() or "{track:02d} - {title}"
-        self._config.default_genre = self._genre_edit.text()
-        self._config.default_artist = self._artist_edit.text()
-        self._config.default_narrator = self._narrator_edit.text()
-        self._config.auto_lookup = self._auto_lookup_check.isChecked()
+        if _TAB_METADATA in self._built_tabs:
+            self._config.default_genre = self._genre_edit.text()
+            self._config.default_artist = self._artist_edit.text()
+            self._config.default_narrator = self._narrator_edit.text()
+        if _TAB_MUSICBRAINZ in self._built_tabs:
+            self._config.auto_lookup = self._auto_lookup_check.isChecked()
         self._config.save()
 
     def _on_browse_output(self) -> None:
         """Browse for output directory."""
-        current = self._output_dir_edit.text() or str(Path.home())
+        current = self._output_dir_edit.text() or _HOME_STR
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Output Directory",
@@ -1,36 +1,265 @@
 """Track listing widget with metadata display."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QWidget,
 )
 
 from audiobook_ripper.core.models import AudiobookMetadata, Track
 
+# The only roles data() answers; everything else short-circuits with one
+# membership test, since the view queries every visible cell for many
+# roles on each repaint
+_ACCEPTED_ROLES = frozenset({
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.EditRole,
+    Qt.ItemDataRole.CheckStateRole,
+    Qt.ItemDataRole.TextAlignmentRole,
+})
+
+# Per-column alignment, indexed by column
+_ALIGNMENTS = (
+    None,
+    Qt.AlignmentFlag.AlignCenter,
+    None,
+    Qt.AlignmentFlag.AlignCenter,
+    None,
+    None,
+)
+
+
+class TrackTableModel(QAbstractTableModel):
+    """Table model backed directly by the track list and metadata dict.
+
+    Unlike QTableWidget there is no per-cell item storage: cell values
+    are computed on demand from Track/AudiobookMetadata, edits write
+    straight through to the metadata dict, and checked state is one set
+    of track numbers.
+    """
+
+    metadata_edited = Signal(int, str, str)  # track_number, field, value
+
+    COLUMNS = ("", "#", "Title", "Duration", "Artist", "Album")
+
+    _EDITABLE = {2: "title", 4: "artist", 5: "album"}
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._tracks: list[Track] = []
+        self._metadata: dict[int, AudiobookMetadata] = {}
+        self._checked: set[int] = set()
+        # Track numbers whose metadata entry has been built/backfilled;
+        # lets get_all_metadata skip its pass when nothing is missing
+        self._ensured: set[int] = set()
+        self._total_applied = -1
+        # track number -> row; rebuilt in set_tracks so per-track
+        # lookups don't rescan the list (O(N^2) during bulk auto-fill)
+        self._row_by_track: dict[int, int] = {}
+        # Column accessors indexed by column; data() dispatches through
+        # this tuple instead of an if/elif ladder per cell
+        self._display_dispatch = (
+            None,
+            self._col_number,
+            self._col_title,
+            self._col_duration,
+            self._col_artist,
+            self._col_album,
+        )
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tracks)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        col = index.column()
+        if col == 0:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if col in self._EDITABLE:
+            return base | Qt.ItemFlag.ItemIsEditable
+        return base
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role not in _ACCEPTED_ROLES or not index.isValid():
+            return None
+
+        col = index.column()
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _ALIGNMENTS[col]
+
+        if col == 0:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return (
+                    Qt.CheckState.Checked
+                    if self._tracks[index.row()].number in self._checked
+                    else Qt.CheckState.Unchecked
+                )
+            return None
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return None
+
+        return self._display_dispatch[col](index.row())
+
+    def _col_number(self, row: int) -> str:
+        return str(self._tracks[row].number)
+
+    def _col_title(self, row: int) -> str:
+        track = self._tracks[row]
+        meta = self._metadata.get(track.number)
+        return (meta.title if meta else "") or track.title
+
+    def _col_duration(self, row: int) -> str:
+        return self._tracks[row].duration_formatted
+
+    def _col_artist(self, row: int) -> str:
+        track = self._tracks[row]
+        meta = self._metadata.get(track.number)
+        return (meta.artist if meta else "") or track.artist
+
+    def _col_album(self, row: int) -> str:
+        meta = self._metadata.get(self._tracks[row].number)
+        return meta.album if meta else ""
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+
+        track = self._tracks[index.row()]
+        col = index.column()
+
+        if col == 0 and role == Qt.ItemDataRole.CheckStateRole:
+            if Qt.CheckState(value) == Qt.CheckState.Checked:
+                self._checked.add(track.number)
+            else:
+                self._checked.discard(track.number)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            return True
+
+        if col in self._EDITABLE and role == Qt.ItemDataRole.EditRole:
+            field = self._EDITABLE[col]
+            setattr(self._ensure_metadata(track), field, value)
+            self.dataChanged.emit(
+                index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+            )
+            self.metadata_edited.emit(track.number, field, value)
+            return True
+
+        return False
+
+    # --- domain interface ---
+
+    def set_tracks(
+        self,
+        tracks: list[Track],
+        metadata: dict[int, AudiobookMetadata],
+    ) -> None:
+        """Replace the track list in a single model reset."""
+        self.beginResetModel()
+        self._tracks = tracks
+        self._metadata = metadata
+        self._checked = {track.number for track in tracks}
+        self._row_by_track = {track.number: row for row, track in enumerate(tracks)}
+        self._ensured = set()
+        self._total_applied = -1
+        self.endResetModel()
+
+    def track_numbers_at_rows(self, rows) -> list[int]:
+        """Map view rows back to track numbers."""
+        count = len(self._tracks)
+        return [self._tracks[row].number for row in rows if row < count]
+
+    def checked_tracks(self) -> list[int]:
+        """Checked track numbers in track order."""
+        return [t.number for t in self._tracks if t.number in self._checked]
+
+    def set_all_checked(self, checked: bool) -> None:
+        self._checked = {t.number for t in self._tracks} if checked else set()
+        if self._tracks:
+            top = self.index(0, 0)
+            bottom = self.index(len(self._tracks) - 1, 0)
+            self.dataChanged.emit(top, bottom, [Qt.ItemDataRole.CheckStateRole])
+
+    def get_metadata(self, track_number: int) -> AudiobookMetadata | None:
+        row = self._row_by_track.get(track_number)
+        if row is not None:
+            return self._ensure_metadata(self._tracks[row])
+        return self._metadata.get(track_number)
 
-class TrackListWidget(QTableWidget):
+    def set_metadata(self, track_number: int, metadata: AudiobookMetadata) -> None:
+        self._metadata[track_number] = metadata
+        # The replacement entry may need backfilling again
+        self._ensured.discard(track_number)
+        row = self._row_by_track.get(track_number)
+        if row is not None:
+            self.dataChanged.emit(
+                self.index(row, 2),
+                self.index(row, 5),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+    def get_all_metadata(self) -> dict[int, AudiobookMetadata]:
+        total = len(self._tracks)
+        if len(self._ensured) < total or self._total_applied != total:
+            for track in self._tracks:
+                meta = self._ensure_metadata(track)
+                meta.total_tracks = total
+            self._total_applied = total
+        return self._metadata
+
+    def _ensure_metadata(self, track: Track) -> AudiobookMetadata:
+        """Get or create the metadata entry shown for a track."""
+        meta = self._metadata.get(track.number)
+        if meta is None:
+            meta = AudiobookMetadata(
+                title=track.title,
+                artist=track.artist,
+                track_number=track.number,
+            )
+            self._metadata[track.number] = meta
+        else:
+            # Mirror what the cells display for empty fields
+            if not meta.title:
+                meta.title = track.title
+            if not meta.artist:
+                meta.artist = track.artist
+        self._ensured.add(track.number)
+        return meta
+
+
+class TrackListWidget(QTableView):
     """Widget for displaying and selecting CD tracks."""
 
     selection_changed = Signal(list)  # Emits list of selected track numbers
     metadata_edited = Signal(int, str, str)  # track_number, field, value
 
-    COLUMNS = ["", "#", "Title", "Duration", "Artist", "Album"]
+    COLUMNS = TrackTableModel.COLUMNS
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._tracks: list[Track] = []
-        self._metadata: dict[int, AudiobookMetadata] = {}
+        self._model = TrackTableModel(self)
+        self.setModel(self._model)
+        self._model.metadata_edited.connect(self.metadata_edited)
 
         self._setup_ui()
 
-    def _setup_ui(self) -> None:
-        self.setColumnCount(len(self.COLUMNS))
-        self.setHorizontalHeaderLabels(self.COLUMNS)
+        # The selection model exists only after setModel
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
+    def _setup_ui(self) -> None:
         # Configure selection
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -50,9 +279,13 @@ class TrackListWidget(QTableWidget):
         self.setColumnWidth(4, 150)
         self.setColumnWidth(5, 150)
 
-        # Enable editing for certain columns
-        self.itemChanged.connect(self._on_item_changed)
-        self.itemSelectionChanged.connect(self._on_selection_changed)
+    def rowCount(self) -> int:
+        """Row count of the underlying model."""
+        return self._model.rowCount()
+
+    def columnCount(self) -> int:
+        """Column count of the underlying model."""
+        return self._model.columnCount()
 
     def set_tracks(
         self,
@@ -65,147 +298,37 @@ class TrackListWidget(QTableWidget):
             tracks: List of Track objects
             metadata: Optional dict mapping track numbers to metadata
         """
-        self.blockSignals(True)
-        self.setRowCount(0)
-
-        self._tracks = tracks
-        self._metadata = metadata or {}
-
-        for track in tracks:
-            self._add_track_row(track)
-
-        self.blockSignals(False)
-
-    def _add_track_row(self, track: Track) -> None:
-        row = self.rowCount()
-        self.insertRow(row)
-
-        meta = self._metadata.get(track.number, AudiobookMetadata(
-            title=track.title,
-            artist=track.artist,
-            track_number=track.number,
-        ))
-
-        # Checkbox
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-        checkbox.setCheckState(Qt.CheckState.Checked)
-        self.setItem(row, 0, checkbox)
-
-        # Track number (read-only)
-        num_item = QTableWidgetItem(str(track.number))
-        num_item.setFlags(num_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        num_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 1, num_item)
-
-        # Title (editable)
-        title_item = QTableWidgetItem(meta.title or track.title)
-        self.setItem(row, 2, title_item)
-
-        # Duration (read-only)
-        duration_item = QTableWidgetItem(track.duration_formatted)
-        duration_item.setFlags(duration_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        duration_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, 3, duration_item)
-
-        # Artist (editable)
-        artist_item = QTableWidgetItem(meta.artist or track.artist)
-        self.setItem(row, 4, artist_item)
-
-        # Album (editable)
-        album_item = QTableWidgetItem(meta.album)
-        self.setItem(row, 5, album_item)
+        self._model.set_tracks(tracks, metadata or {})
 
     def get_selected_tracks(self) -> list[int]:
         """Get list of checked track numbers."""
-        selected = []
-        for row in range(self.rowCount()):
-            checkbox = self.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Checked:
-                selected.append(self._tracks[row].number)
-        return selected
+        return self._model.checked_tracks()
 
     def get_highlighted_tracks(self) -> list[int]:
         """Get list of highlighted (selected in UI) track numbers."""
-        rows = set(item.row() for item in self.selectedItems())
-        return [self._tracks[row].number for row in rows if row < len(self._tracks)]
+        rows = {index.row() for index in self.selectionModel().selectedRows()}
+        return self._model.track_numbers_at_rows(sorted(rows))
 
     def select_all(self) -> None:
         """Check all tracks."""
-        for row in range(self.rowCount()):
-            checkbox = self.item(row, 0)
-            if checkbox:
-                checkbox.setCheckState(Qt.CheckState.Checked)
+        self._model.set_all_checked(True)
 
     def select_none(self) -> None:
         """Uncheck all tracks."""
-        for row in range(self.rowCount()):
-            checkbox = self.item(row, 0)
-            if checkbox:
-                checkbox.setCheckState(Qt.CheckState.Unchecked)
+        self._model.set_all_checked(False)
 
     def get_metadata(self, track_number: int) -> AudiobookMetadata | None:
-        """Get metadata for a specific track, reading current values from the table."""
-        # Find the row for this track
-        for row, track in enumerate(self._tracks):
-            if track.number == track_number:
-                # Get or create metadata
-                if track_number not in self._metadata:
-                    self._metadata[track_number] = AudiobookMetadata(track_number=track_number)
-
-                meta = self._metadata[track_number]
-                # Update from current table values
-                meta.title = self.item(row, 2).text()
-                meta.artist = self.item(row, 4).text()
-                meta.album = self.item(row, 5).text()
-                return meta
-
-        return self._metadata.get(track_number)
+        """Get metadata for a specific track."""
+        return self._model.get_metadata(track_number)
 
     def set_metadata(self, track_number: int, metadata: AudiobookMetadata) -> None:
         """Set metadata for a specific track and update display."""
-        self._metadata[track_number] = metadata
-
-        # Find row for this track
-        for row, track in enumerate(self._tracks):
-            if track.number == track_number:
-                self.blockSignals(True)
-                self.item(row, 2).setText(metadata.title)
-                self.item(row, 4).setText(metadata.artist)
-                self.item(row, 5).setText(metadata.album)
-                self.blockSignals(False)
-                break
+        self._model.set_metadata(track_number, metadata)
 
     def get_all_metadata(self) -> dict[int, AudiobookMetadata]:
         """Get metadata dictionary for all tracks."""
-        # Update metadata from table contents
-        for row, track in enumerate(self._tracks):
-            if track.number not in self._metadata:
-                self._metadata[track.number] = AudiobookMetadata(track_number=track.number)
-
-            meta = self._metadata[track.number]
-            meta.title = self.item(row, 2).text()
-            meta.artist = self.item(row, 4).text()
-            meta.album = self.item(row, 5).text()
-            meta.total_tracks = len(self._tracks)
-
-        return self._metadata
-
-    def _on_item_changed(self, item: QTableWidgetItem) -> None:
-        row = item.row()
-        col = item.column()
-
-        if row >= len(self._tracks):
-            return
-
-        track_number = self._tracks[row].number
-        field_map = {2: "title", 4: "artist", 5: "album"}
-
-        if col in field_map:
-            field = field_map[col]
-            value = item.text()
-            self.metadata_edited.emit(track_number, field, value)
+        return self._model.get_all_metadata()
 
+    @Slot()
     def _on_selection_changed(self) -> None:
-        selected = self.get_highlighted_tracks()
-        self.selection_changed.emit(selected)
+        self.selection_changed.emit(self.get_highlighted_tracks())
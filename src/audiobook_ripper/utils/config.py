@@ -1,13 +1,60 @@
 """Configuration management for the audiobook ripper."""
 
+import functools
 import json
-from dataclasses import asdict, dataclass, field
+import string
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 
-@dataclass
+# Strips characters Windows forbids in filenames in one C-level pass
+_SANITIZE_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
+
+@functools.lru_cache(maxsize=1)
+def _config_path() -> Path:
+    """Resolve (and create) the config directory once per process.
+
+    mkdir stats the directory even with exist_ok=True, so the result is
+    cached; a $HOME change mid-process won't be observed.
+    """
+    config_dir = Path.home() / ".audiobook-ripper"
+    config_dir.mkdir(exist_ok=True)
+    return config_dir / "config.json"
+
+
+def _compile_template(template: str):
+    """Compile a format template into a render callable.
+
+    str.format re-parses the template on every call; parsing once and
+    joining pre-split segments does the work a single time per template.
+    """
+    segments = list(string.Formatter().parse(template))
+
+    def render(values: dict) -> str:
+        parts = []
+        for literal, field_name, spec, conversion in segments:
+            if literal:
+                parts.append(literal)
+            if field_name is not None:
+                value = values[field_name]
+                if conversion == "s":
+                    value = str(value)
+                elif conversion == "r":
+                    value = repr(value)
+                parts.append(format(value, spec or ""))
+        return "".join(parts)
+
+    return render
+
+
+@dataclass(slots=True)
 class Config:
-    """Application configuration."""
+    """Application configuration.
+
+    Slotted so the frequently-read settings live in slot descriptors
+    instead of a per-instance __dict__.
+    """
 
     # Output settings
     output_directory: str = ""
@@ -27,31 +74,47 @@ class Config:
     # MusicBrainz settings
     auto_lookup: bool = True
 
+    # Last FFmpeg version seen; non-empty means the probe can be skipped
+    ffmpeg_version: str = ""
+
+    # Internal caches; underscore-prefixed fields are never persisted
+    _last_saved: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    _template_fn: object = field(default=None, init=False, repr=False, compare=False)
+    _template_src: str | None = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def get_config_path(cls) -> Path:
         """Get the path to the config file."""
-        config_dir = Path.home() / ".audiobook-ripper"
-        config_dir.mkdir(exist_ok=True)
-        return config_dir / "config.json"
+        return _config_path()
 
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from disk."""
         config_path = cls.get_config_path()
-        if config_path.exists():
-            try:
-                with open(config_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
-            except (json.JSONDecodeError, OSError):
-                pass
-        return cls()
+        try:
+            data = json.loads(config_path.read_bytes())
+            return cls(**{
+                k: v
+                for k, v in data.items()
+                if k in cls.__dataclass_fields__ and not k.startswith("_")
+            })
+        except (json.JSONDecodeError, OSError):
+            return cls()
 
     def save(self) -> None:
-        """Save configuration to disk."""
-        config_path = self.get_config_path()
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=2)
+        """Save configuration to disk, skipping unchanged content."""
+        # All fields are primitives, so a flat comprehension replaces the
+        # recursive deep-copy asdict would do
+        payload = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if not f.name.startswith("_")
+        }
+        serialized = json.dumps(payload, indent=2).encode("utf-8")
+        if serialized == self._last_saved:
+            return
+        self.get_config_path().write_bytes(serialized)
+        self._last_saved = serialized
 
     def get_output_dir(self) -> Path:
         """Get output directory, defaulting to user's Music folder."""
@@ -62,9 +125,10 @@ class Config:
     def format_filename(self, track_number: int, title: str, **kwargs) -> str:
         """Format a filename using the template."""
         # Sanitize title for filesystem
-        safe_title = "".join(c for c in title if c not in '<>:"/\\|?*')
-        return self.filename_template.format(
-            track=track_number,
-            title=safe_title,
-            **kwargs,
-        )
+        safe_title = title.translate(_SANITIZE_TABLE)
+
+        # Recompile only when the template actually changed
+        if self._template_src != self.filename_template:
+            self._template_fn = _compile_template(self.filename_template)
+            self._template_src = self.filename_template
+        return self._template_fn({"track": track_number, "title": safe_title, **kwargs})
@@ -1,47 +1,73 @@
 """FFmpeg utility functions."""
 
+import functools
 import re
 import subprocess
 
+# First line of `ffmpeg -version` output: "ffmpeg version X.Y.Z ..."
+_VERSION_RE = re.compile(r"ffmpeg version (\S+)")
 
-def check_ffmpeg() -> bool:
-    """Check if FFmpeg is available on the system.
+
+@functools.lru_cache(maxsize=1)
+def probe_ffmpeg() -> dict:
+    """Probe FFmpeg once for availability, version and codec support.
+
+    Two subprocess runs (`-version`, then `-demuxers -encoders`) replace
+    the three the individual checks used to spawn. The result is cached
+    for the process lifetime; FFmpeg does not appear or disappear while
+    the app is running.
 
     Returns:
-        True if FFmpeg is available and working
+        Dict with keys "available" (bool), "version" (str | None),
+        "libcdio" (bool) and "libmp3lame" (bool)
     """
+    caps = {"available": False, "version": None, "libcdio": False, "libmp3lame": False}
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            ["ffmpeg", "-hide_banner", "-version"],
             capture_output=True,
+            text=True,
             timeout=10,
         )
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return False
+        return caps
+    if result.returncode != 0:
+        return caps
+    caps["available"] = True
+    match = _VERSION_RE.search(result.stdout)
+    if match:
+        caps["version"] = match.group(1)
 
-
-def get_ffmpeg_version() -> str | None:
-    """Get the FFmpeg version string.
-
-    Returns:
-        Version string (e.g., "6.0") or None if not available
-    """
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            ["ffmpeg", "-hide_banner", "-demuxers", "-encoders"],
             capture_output=True,
             text=True,
             timeout=10,
         )
-        if result.returncode == 0:
-            # Parse version from first line: "ffmpeg version X.Y.Z ..."
-            match = re.search(r"ffmpeg version (\S+)", result.stdout)
-            if match:
-                return match.group(1)
+        caps["libcdio"] = "libcdio" in result.stdout
+        caps["libmp3lame"] = "libmp3lame" in result.stdout
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
-    return None
+    return caps
+
+
+def check_ffmpeg() -> bool:
+    """Check if FFmpeg is available on the system.
+
+    Returns:
+        True if FFmpeg is available and working
+    """
+    return probe_ffmpeg()["available"]
+
+
+def get_ffmpeg_version() -> str | None:
+    """Get the FFmpeg version string.
+
+    Returns:
+        Version string (e.g., "6.0") or None if not available
+    """
+    return probe_ffmpeg()["version"]
 
 
 def check_libcdio() -> bool:
@@ -50,16 +76,7 @@ def check_libcdio() -> bool:
     Returns:
         True if libcdio demuxer is available
     """
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-demuxers"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return "libcdio" in result.stdout
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return False
+    return probe_ffmpeg()["libcdio"]
 
 
 def check_lame_encoder() -> bool:
@@ -68,13 +85,9 @@ def check_lame_encoder() -> bool:
     Returns:
         True if libmp3lame encoder is available
     """
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-encoders"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return "libmp3lame" in result.stdout
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return False
+    return probe_ffmpeg()["libmp3lame"]
+
+
+def _reset_ffmpeg_cache() -> None:
+    """Clear the memoized probe result (used by tests)."""
+    probe_ffmpeg.cache_clear()
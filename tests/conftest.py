@@ -1,8 +1,7 @@
 """Pytest fixtures and mock factories for testing."""
 
 from pathlib import Path
-from typing import Callable
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
@@ -15,11 +14,17 @@ from audiobook_ripper.core.interfaces import (
     IRipper,
 )
 from audiobook_ripper.core.models import AudiobookMetadata, DriveInfo, Track
+from tests.stubs import (
+    StubEncoder,
+    StubMetadataService,
+    StubMusicBrainzService,
+    StubRipper,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tracks() -> list[Track]:
-    """Sample track list for testing."""
+    """Sample track list for testing (session-scoped; treat as read-only)."""
     return [
         Track(number=1, duration_seconds=180.0, title="Chapter 1", artist="Test Author"),
         Track(number=2, duration_seconds=240.0, title="Chapter 2", artist="Test Author"),
@@ -27,18 +32,18 @@ def sample_tracks() -> list[Track]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_drives() -> list[DriveInfo]:
-    """Sample drive list for testing."""
+    """Sample drive list for testing (session-scoped; treat as read-only)."""
     return [
         DriveInfo(letter="D", name="Test DVD Drive", has_disc=True),
         DriveInfo(letter="E", name="Test BD Drive", has_disc=False),
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata() -> AudiobookMetadata:
-    """Sample metadata for testing."""
+    """Sample metadata for testing (session-scoped; treat as read-only)."""
     return AudiobookMetadata(
         title="Test Chapter",
         artist="Test Author",
@@ -64,59 +69,27 @@ def mock_cd_drive(sample_drives, sample_tracks) -> Mock:
 
 
 @pytest.fixture
-def mock_ripper() -> Mock:
-    """Mock ripper service."""
-    mock = Mock(spec=IRipper)
-
-    def rip_track(drive, track_number, output_path, progress_callback=None):
-        # Simulate ripping by creating the output file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(b"RIFF" + b"\x00" * 100)  # Fake WAV header
-        if progress_callback:
-            progress_callback(1.0)
-
-    mock.rip_track.side_effect = rip_track
-    return mock
+def mock_ripper() -> StubRipper:
+    """Stub ripper service."""
+    return StubRipper()
 
 
 @pytest.fixture
-def mock_encoder() -> Mock:
-    """Mock encoder service."""
-    mock = Mock(spec=IEncoder)
-
-    def encode_to_mp3(input_path, output_path, bitrate=192, progress_callback=None):
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(b"ID3" + b"\x00" * 100)  # Fake MP3 header
-        if progress_callback:
-            progress_callback(1.0)
-
-    mock.encode_to_mp3.side_effect = encode_to_mp3
-    return mock
+def mock_encoder() -> StubEncoder:
+    """Stub encoder service."""
+    return StubEncoder()
 
 
 @pytest.fixture
-def mock_metadata_service() -> Mock:
-    """Mock metadata service."""
-    mock = Mock(spec=IMetadataService)
-    mock.read_metadata.return_value = AudiobookMetadata()
-    return mock
+def mock_metadata_service() -> StubMetadataService:
+    """Stub metadata service."""
+    return StubMetadataService()
 
 
 @pytest.fixture
-def mock_musicbrainz() -> Mock:
-    """Mock MusicBrainz service."""
-    mock = Mock(spec=IMusicBrainzService)
-    mock.lookup_by_disc_id.return_value = {
-        "title": "Test Album",
-        "artist": "Test Artist",
-        "year": 2024,
-        "tracks": [
-            {"number": 1, "title": "Track 1", "duration": 180},
-            {"number": 2, "title": "Track 2", "duration": 240},
-        ],
-    }
-    mock.search_release.return_value = []
-    return mock
+def mock_musicbrainz() -> StubMusicBrainzService:
+    """Stub MusicBrainz service."""
+    return StubMusicBrainzService()
 
 
 @pytest.fixture
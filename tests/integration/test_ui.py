@@ -116,8 +116,8 @@ class TestTrackListWidget:
 
         widget.set_metadata(1, sample_metadata)
 
-        assert widget.item(0, 2).text() == sample_metadata.title
-        assert widget.item(0, 4).text() == sample_metadata.artist
+        assert widget.model().index(0, 2).data() == sample_metadata.title
+        assert widget.model().index(0, 4).data() == sample_metadata.artist
 
     def test_get_all_metadata(self, qapp, sample_tracks):
         """Test getting metadata for all tracks."""
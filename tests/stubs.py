@@ -0,0 +1,143 @@
+"""Lightweight service stubs for tests.
+
+Concrete classes are much cheaper than Mock(spec=...), which rebuilds a
+spec'd child mock (with inspect.signature introspection) on every
+attribute access. Only services whose call history is asserted on stay
+as Mocks in conftest.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+from audiobook_ripper.core.models import AudiobookMetadata, EncodeJob
+
+
+class StubRipper:
+    """IRipper stub that fakes output files instead of touching a drive."""
+
+    def rip_track(
+        self,
+        drive: str,
+        track_number: int,
+        output_path: Path,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"RIFF" + b"\x00" * 100)  # Fake WAV header
+        if progress_callback:
+            progress_callback(1.0)
+
+    def rip_disc(
+        self,
+        drive: str,
+        output_path: Path,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        self.rip_track(drive, 0, output_path, progress_callback)
+
+    def rip_and_encode(
+        self,
+        drive: str,
+        track_number: int,
+        output_path: Path,
+        bitrate: int = 192,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"ID3" + b"\x00" * 100)  # Fake MP3 header
+        if progress_callback:
+            progress_callback(1.0)
+
+    def rip_and_encode_disc(
+        self,
+        drive: str,
+        output_path: Path,
+        bitrate: int = 192,
+        total_duration: float | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> None:
+        self.rip_and_encode(drive, 0, output_path, bitrate, progress_callback)
+
+    def rip_and_split(
+        self,
+        drive: str,
+        output_dir: Path,
+        chapters: list[dict],
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[Path]:
+        paths = []
+        for chapter in chapters:
+            path = output_dir / f"track{chapter.get('number', len(paths) + 1):02d}.wav"
+            self.rip_track(drive, chapter.get("number", 0), path)
+            paths.append(path)
+        if progress_callback:
+            progress_callback(1.0)
+        return paths
+
+    def get_chapters(self, drive: str, disc_id: str | None = None) -> list[dict]:
+        return []
+
+    def cancel(self) -> None:
+        pass
+
+
+class StubEncoder:
+    """IEncoder stub that writes fake MP3 bytes."""
+
+    def encode_to_mp3(
+        self,
+        input_path: Path,
+        output_path: Path,
+        bitrate: int = 192,
+        progress_callback: Callable[[float], None] | None = None,
+        duration_seconds: float | None = None,
+    ) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"ID3" + b"\x00" * 100)  # Fake MP3 header
+        if progress_callback:
+            progress_callback(1.0)
+
+    def encode_many(
+        self,
+        jobs: list[EncodeJob],
+        max_workers: int | None = None,
+        job_callback: Callable[[EncodeJob, str | None], None] | None = None,
+    ) -> list[tuple[EncodeJob, str | None]]:
+        results = []
+        for job in jobs:
+            self.encode_to_mp3(job.input_path, job.output_path, job.bitrate)
+            if job_callback:
+                job_callback(job, None)
+            results.append((job, None))
+        return results
+
+    def cancel(self) -> None:
+        pass
+
+
+class StubMetadataService:
+    """IMetadataService stub; reads return an empty metadata object."""
+
+    def read_metadata(self, file_path: Path) -> AudiobookMetadata:
+        return AudiobookMetadata()
+
+    def write_metadata(self, file_path: Path, metadata: AudiobookMetadata) -> None:
+        pass
+
+
+class StubMusicBrainzService:
+    """IMusicBrainzService stub with a canned lookup result."""
+
+    def lookup_by_disc_id(self, disc_id: str) -> dict | None:
+        return {
+            "title": "Test Album",
+            "artist": "Test Artist",
+            "year": 2024,
+            "tracks": [
+                {"number": 1, "title": "Track 1", "duration": 180},
+                {"number": 2, "title": "Track 2", "duration": 240},
+            ],
+        }
+
+    def search_release(self, query: str) -> list[dict]:
+        return []
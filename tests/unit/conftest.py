@@ -0,0 +1,152 @@
+"""Shared mock builders for the unit tests.
+
+Entering a mock.patch context and hand-assembling MagicMocks per test is
+the bulk of setup cost in these modules. The fixtures here swap module
+attributes directly via monkeypatch (much cheaper than mock.patch) and
+preset the recurring boilerplate — TimeoutExpired on subprocess mocks,
+the tag dunders on mutagen audio mocks — in one place.
+"""
+
+import subprocess as sp
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from audiobook_ripper.services import cd_drive as cd_drive_module
+from audiobook_ripper.services import encoder as encoder_module
+from audiobook_ripper.services import ffprobe as ffprobe_module
+from audiobook_ripper.services import metadata as metadata_module
+from audiobook_ripper.services import ripper as ripper_module
+from audiobook_ripper.utils import ffmpeg as ffmpeg_module
+
+_SUBPROCESS_TARGETS = {
+    "ffmpeg": ffmpeg_module,
+    "encoder": encoder_module,
+    "ffprobe": ffprobe_module,
+    "ripper": ripper_module,
+}
+
+
+@pytest.fixture
+def patch_subprocess(monkeypatch):
+    """Factory swapping a module's subprocess for a preset Mock.
+
+    Call with "ffmpeg", "encoder", "ffprobe" or "ripper"; the returned mock has
+    the real TimeoutExpired attached so except clauses keep working.
+    """
+    def _patch(target: str) -> Mock:
+        mock = Mock()
+        mock.TimeoutExpired = sp.TimeoutExpired
+        monkeypatch.setattr(_SUBPROCESS_TARGETS[target], "subprocess", mock)
+        return mock
+
+    return _patch
+
+
+@pytest.fixture
+def mock_ctypes(monkeypatch):
+    """Swap the cd_drive module's ctypes for a Mock."""
+    mock = Mock()
+    monkeypatch.setattr(cd_drive_module, "ctypes", mock)
+    return mock
+
+
+@pytest.fixture
+def discid_mock(monkeypatch):
+    """Install a Mock as the discid module for the test's duration.
+
+    cd_drive imports discid lazily inside its methods, so seeding
+    sys.modules is enough; tests stamp read.return_value/side_effect.
+    """
+    mock = Mock()
+    monkeypatch.setitem(sys.modules, "discid", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_mp3(monkeypatch):
+    """Swap the metadata module's MP3 loader for a Mock."""
+    mock = Mock()
+    monkeypatch.setattr(metadata_module, "MP3", mock)
+    return mock
+
+
+@pytest.fixture
+def make_mp3_audio():
+    """Factory for mutagen-style audio mocks with preset tag dunders.
+
+    ``present`` lists the tag keys __contains__ answers True for;
+    ``value`` is the text returned by __getitem__ (a string, or a
+    callable taking the key).
+    """
+    def _make(present=(), value=None) -> MagicMock:
+        keys = tuple(present)
+        tags = MagicMock()
+        tags.__contains__ = lambda self, key: key in keys
+        if value is not None:
+            text = value if callable(value) else (lambda key: value)
+            # SimpleNamespace is all a mutagen frame needs to look like
+            # here, and is far cheaper than a MagicMock per access
+            tags.__getitem__ = lambda self, key: SimpleNamespace(text=[text(key)])
+        tags.__iter__ = lambda self: iter(())
+        audio = Mock()
+        audio.tags = tags
+        return audio
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def wav_stub(tmp_path_factory):
+    """Dummy WAV input; its content is never read since ffmpeg is mocked."""
+    path = tmp_path_factory.mktemp("stub") / "input.wav"
+    path.write_bytes(b"RIFF" + b"\x00" * 100)
+    return path
+
+
+@pytest.fixture(scope="session")
+def mp3_stub(tmp_path_factory):
+    """Dummy MP3 file; its content is never read since MP3 is mocked."""
+    path = tmp_path_factory.mktemp("stub") / "test.mp3"
+    path.write_bytes(b"ID3" + b"\x00" * 100)
+    return path
+
+
+@pytest.fixture
+def make_ffmpeg_process():
+    """Factory for mocked ffmpeg Popen handles.
+
+    ``stdout_chunks`` feeds successive stdout.read() calls; a single
+    chunk becomes a steady return value.
+    """
+    def _make(returncode=0, stdout_chunks=(b"",), stderr="") -> SimpleNamespace:
+        chunks = iter(stdout_chunks)
+        final = stdout_chunks[-1]
+
+        def read(*_args):
+            return next(chunks, final)
+
+        # Plain namespaces: the encoder only touches stdout.read, wait
+        # and returncode, and SimpleNamespace skips MagicMock's lazy
+        # child-attribute machinery
+        return SimpleNamespace(
+            returncode=returncode,
+            stdout=SimpleNamespace(read=read),
+            stderr=SimpleNamespace(read=lambda *_args: stderr),
+            wait=lambda timeout=None: returncode,
+            terminate=lambda: None,
+            kill=lambda: None,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def run_result():
+    """Factory for completed-process results (returncode/stdout carriers)."""
+    def _make(returncode=0, stdout="") -> SimpleNamespace:
+        return SimpleNamespace(returncode=returncode, stdout=stdout)
+
+    return _make
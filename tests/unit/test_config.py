@@ -1,5 +1,6 @@
 """Tests for configuration management."""
 
+import copy
 import json
 import pytest
 from pathlib import Path
@@ -8,21 +9,44 @@ from unittest.mock import patch
 from audiobook_ripper.utils.config import Config
 
 
+@pytest.fixture(scope="module")
+def default_config() -> Config:
+    """Default Config built once per module; treat as read-only."""
+    return Config()
+
+
+@pytest.fixture
+def config(default_config) -> Config:
+    """Mutable per-test copy of the default Config."""
+    return copy.copy(default_config)
+
+
+@pytest.fixture(scope="module")
+def default_payload(default_config) -> dict:
+    """Serialized default config, built once; copy before mutating."""
+    from dataclasses import fields
+
+    return {
+        f.name: getattr(default_config, f.name)
+        for f in fields(default_config)
+        if not f.name.startswith("_")
+    }
+
+
 class TestConfig:
     """Tests for Config class."""
 
-    def test_default_values(self):
+    def test_default_values(self, default_config):
         """Test default configuration values."""
-        config = Config()
+        config = default_config
 
         assert config.default_bitrate == 192
         assert config.default_genre == "Audiobook"
         assert config.auto_lookup is True
         assert config.filename_template == "{track:02d} - {title}"
 
-    def test_get_output_dir_default(self):
+    def test_get_output_dir_default(self, config):
         """Test default output directory."""
-        config = Config()
         config.output_directory = ""
 
         output_dir = config.get_output_dir()
@@ -30,9 +54,8 @@ class TestConfig:
         assert "Music" in str(output_dir)
         assert "Audiobooks" in str(output_dir)
 
-    def test_get_output_dir_custom(self, tmp_path):
+    def test_get_output_dir_custom(self, config, tmp_path):
         """Test custom output directory."""
-        config = Config()
         custom_path = str(tmp_path / "custom" / "path")
         config.output_directory = custom_path
 
@@ -40,19 +63,16 @@ class TestConfig:
 
         assert str(output_dir) == custom_path
 
-    def test_format_filename_basic(self):
+    def test_format_filename_basic(self, config):
         """Test basic filename formatting."""
-        config = Config()
         config.filename_template = "{track:02d} - {title}"
 
         filename = config.format_filename(5, "Test Title")
 
         assert filename == "05 - Test Title"
 
-    def test_format_filename_sanitizes_title(self):
+    def test_format_filename_sanitizes_title(self, config):
         """Test that filename formatting sanitizes invalid characters."""
-        config = Config()
-
         filename = config.format_filename(1, 'Invalid: "Title" <here>')
 
         assert ":" not in filename
@@ -94,10 +114,11 @@ class TestConfig:
             # Should return default config
             assert config.default_bitrate == 192
 
-    def test_load_ignores_unknown_fields(self, tmp_path):
+    def test_load_ignores_unknown_fields(self, default_payload, tmp_path):
         """Test that loading ignores unknown fields."""
         config_path = tmp_path / "config.json"
         config_path.write_text(json.dumps({
+            **default_payload,
             "default_bitrate": 256,
             "unknown_field": "should be ignored"
         }))
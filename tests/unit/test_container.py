@@ -5,6 +5,17 @@ import pytest
 from audiobook_ripper.core.container import Container
 
 
+class IService:
+    """Marker interface shared by the container tests."""
+
+
+class ServiceImpl(IService):
+    """Trivial implementation shared by the container tests."""
+
+    def __init__(self):
+        self.created = True
+
+
 class TestContainer:
     """Tests for the Container class."""
 
@@ -12,12 +23,6 @@ class TestContainer:
         """Test registering and resolving a service."""
         container = Container()
 
-        class IService:
-            pass
-
-        class ServiceImpl(IService):
-            pass
-
         impl = ServiceImpl()
         container.register(IService, impl)
 
@@ -28,9 +33,6 @@ class TestContainer:
         """Test that resolving unregistered service raises KeyError."""
         container = Container()
 
-        class IService:
-            pass
-
         with pytest.raises(KeyError) as exc_info:
             container.resolve(IService)
 
@@ -40,13 +42,6 @@ class TestContainer:
         """Test registering a factory function."""
         container = Container()
 
-        class IService:
-            pass
-
-        class ServiceImpl(IService):
-            def __init__(self):
-                self.created = True
-
         container.register_factory(IService, ServiceImpl)
 
         resolved = container.resolve(IService)
@@ -57,17 +52,14 @@ class TestContainer:
         """Test that factory creates singleton on first resolve."""
         container = Container()
 
-        class IService:
-            pass
-
         call_count = 0
 
-        class ServiceImpl(IService):
+        class CountingImpl(IService):
             def __init__(self):
                 nonlocal call_count
                 call_count += 1
 
-        container.register_factory(IService, ServiceImpl)
+        container.register_factory(IService, CountingImpl)
 
         first = container.resolve(IService)
         second = container.resolve(IService)
@@ -75,42 +67,26 @@ class TestContainer:
         assert first is second
         assert call_count == 1
 
-    def test_is_registered_true(self):
-        """Test is_registered returns True for registered service."""
+    @pytest.mark.parametrize("register_fn, expected", [
+        pytest.param(
+            lambda c: c.register(IService, object()), True, id="instance"),
+        pytest.param(
+            lambda c: None, False, id="unregistered"),
+        pytest.param(
+            lambda c: c.register_factory(IService, lambda: object()), True,
+            id="factory"),
+    ])
+    def test_is_registered(self, register_fn, expected):
+        """Test is_registered for instance, factory, and missing registrations."""
         container = Container()
 
-        class IService:
-            pass
-
-        container.register(IService, object())
-        assert container.is_registered(IService) is True
-
-    def test_is_registered_false(self):
-        """Test is_registered returns False for unregistered service."""
-        container = Container()
-
-        class IService:
-            pass
-
-        assert container.is_registered(IService) is False
-
-    def test_is_registered_factory(self):
-        """Test is_registered returns True for factory registration."""
-        container = Container()
-
-        class IService:
-            pass
-
-        container.register_factory(IService, lambda: object())
-        assert container.is_registered(IService) is True
+        register_fn(container)
+        assert container.is_registered(IService) is expected
 
     def test_clear(self):
         """Test clearing all registrations."""
         container = Container()
 
-        class IService:
-            pass
-
         container.register(IService, object())
         assert container.is_registered(IService)
 
@@ -121,9 +97,6 @@ class TestContainer:
         """Test that re-registering overwrites previous registration."""
         container = Container()
 
-        class IService:
-            pass
-
         first = object()
         second = object()
 
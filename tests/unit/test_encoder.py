@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 
 from audiobook_ripper.services.encoder import EncoderService, check_ffmpeg_available
 
@@ -10,9 +10,18 @@ from audiobook_ripper.services.encoder import EncoderService, check_ffmpeg_avail
 class TestEncoderService:
     """Tests for EncoderService."""
 
+    # Fixed progress stream shared by the encoding tests
+    _PROGRESS_CHUNKS = (b"out_time_ms=1000000\nout_time_ms=2000000\n", b"")
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def encoder():
+        """Shared EncoderService; the service holds no per-test state."""
+        return EncoderService()
+
     @pytest.fixture
-    def encoder(self):
-        """Create an EncoderService instance."""
+    def isolated_encoder(self):
+        """Fresh EncoderService for tests that poke at internal state."""
         return EncoderService()
 
     def test_encode_missing_input_file(self, encoder, tmp_path):
@@ -23,21 +32,15 @@ class TestEncoderService:
         with pytest.raises(FileNotFoundError):
             encoder.encode_to_mp3(input_path, output_path)
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_encode_success(self, mock_subprocess, encoder, tmp_path):
+    def test_encode_success(self, patch_subprocess, make_ffmpeg_process, encoder, wav_stub, tmp_path):
         """Test successful encoding."""
-        input_path = tmp_path / "input.wav"
-        input_path.write_bytes(b"RIFF" + b"\x00" * 100)
+        input_path = wav_stub
         output_path = tmp_path / "output.mp3"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.stdout.__iter__ = Mock(return_value=iter([
-            "out_time_ms=1000000\n",
-            "out_time_ms=2000000\n",
-        ]))
-        mock_subprocess.Popen.return_value = mock_process
-        mock_subprocess.run.return_value = MagicMock(returncode=0, stdout="10.0")
+        mock_subprocess = patch_subprocess("encoder")
+        mock_subprocess.Popen.return_value = make_ffmpeg_process(
+            stdout_chunks=self._PROGRESS_CHUNKS,
+        )
 
         progress_values = []
         encoder.encode_to_mp3(input_path, output_path, progress_callback=lambda p: progress_values.append(p))
@@ -48,63 +51,74 @@ class TestEncoderService:
         assert "-codec:a" in call_args
         assert "libmp3lame" in call_args
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_encode_with_custom_bitrate(self, mock_subprocess, encoder, tmp_path):
+    def test_encode_with_custom_bitrate(self, patch_subprocess, make_ffmpeg_process, encoder, wav_stub, tmp_path):
         """Test encoding with custom bitrate."""
-        input_path = tmp_path / "input.wav"
-        input_path.write_bytes(b"RIFF" + b"\x00" * 100)
+        input_path = wav_stub
         output_path = tmp_path / "output.mp3"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.stdout.__iter__ = Mock(return_value=iter([]))
-        mock_subprocess.Popen.return_value = mock_process
-        mock_subprocess.run.return_value = MagicMock(returncode=0, stdout="10.0")
+        mock_subprocess = patch_subprocess("encoder")
+        mock_subprocess.Popen.return_value = make_ffmpeg_process()
 
         encoder.encode_to_mp3(input_path, output_path, bitrate=320)
 
         call_args = mock_subprocess.Popen.call_args[0][0]
         assert "320k" in call_args
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_encode_failure(self, mock_subprocess, encoder, tmp_path):
+    def test_encode_failure(self, patch_subprocess, make_ffmpeg_process, encoder, wav_stub, tmp_path):
         """Test handling of encoding failure."""
-        input_path = tmp_path / "input.wav"
-        input_path.write_bytes(b"RIFF" + b"\x00" * 100)
+        input_path = wav_stub
         output_path = tmp_path / "output.mp3"
 
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.stdout.__iter__ = Mock(return_value=iter([]))
-        mock_process.stderr.read.return_value = "Encoding error"
-        mock_subprocess.Popen.return_value = mock_process
-        mock_subprocess.run.return_value = MagicMock(returncode=0, stdout="10.0")
+        mock_subprocess = patch_subprocess("encoder")
+        mock_subprocess.Popen.return_value = make_ffmpeg_process(
+            returncode=1,
+            stderr="Encoding error",
+        )
 
         with pytest.raises(RuntimeError) as exc_info:
             encoder.encode_to_mp3(input_path, output_path)
 
         assert "FFmpeg encoding failed" in str(exc_info.value)
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_cancel_terminates_process(self, mock_subprocess, encoder):
-        """Test that cancel terminates the running process."""
-        mock_process = MagicMock()
+    def test_cancel_terminates_processes(self, patch_subprocess, isolated_encoder):
+        """Test that cancel terminates all running processes."""
+        mock_subprocess = patch_subprocess("encoder")
+        mock_process = Mock()
         mock_subprocess.Popen.return_value = mock_process
 
-        encoder._process = mock_process
-        encoder.cancel()
+        isolated_encoder._processes = {id(mock_process): mock_process}
+        isolated_encoder.cancel()
 
         mock_process.terminate.assert_called_once()
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_get_duration(self, mock_subprocess, encoder, tmp_path):
-        """Test getting file duration."""
+    def test_encode_many_runs_all_jobs(self, patch_subprocess, make_ffmpeg_process, encoder, wav_stub, tmp_path):
+        """Test that encode_many encodes every job and reports results."""
+        from audiobook_ripper.core.models import EncodeJob
+
+        jobs = [
+            EncodeJob(input_path=wav_stub, output_path=tmp_path / f"out{i}.mp3")
+            for i in range(3)
+        ]
+
+        mock_subprocess = patch_subprocess("encoder")
+        mock_subprocess.Popen.return_value = make_ffmpeg_process()
+
+        completed = []
+        results = encoder.encode_many(jobs, job_callback=lambda job, error: completed.append(job))
+
+        assert len(results) == 3
+        assert len(completed) == 3
+        assert all(error is None for _, error in results)
+
+    def test_get_duration(self, patch_subprocess, encoder, tmp_path, run_result):
+        """Test getting file duration via the shared ffprobe helper."""
         file_path = tmp_path / "test.wav"
         file_path.write_bytes(b"RIFF" + b"\x00" * 100)
 
-        mock_subprocess.run.return_value = MagicMock(
+        mock_subprocess = patch_subprocess("ffprobe")
+        mock_subprocess.run.return_value = run_result(
             returncode=0,
-            stdout="123.456\n"
+            stdout='{"format": {"duration": "123.456"}, "chapters": []}'
         )
 
         duration = encoder._get_duration(file_path)
@@ -115,27 +129,24 @@ class TestEncoderService:
 class TestCheckFFmpegAvailable:
     """Tests for check_ffmpeg_available function."""
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_ffmpeg_available(self, mock_subprocess):
+    def test_ffmpeg_available(self, patch_subprocess, run_result):
         """Test detection when FFmpeg is available."""
-        mock_subprocess.run.return_value = MagicMock(returncode=0)
+        mock_subprocess = patch_subprocess("encoder")
+        mock_subprocess.run.return_value = run_result(returncode=0)
 
         assert check_ffmpeg_available() is True
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_ffmpeg_not_available(self, mock_subprocess):
+    def test_ffmpeg_not_available(self, patch_subprocess):
         """Test detection when FFmpeg is not installed."""
-        import subprocess as sp
+        mock_subprocess = patch_subprocess("encoder")
         mock_subprocess.run.side_effect = FileNotFoundError()
-        mock_subprocess.TimeoutExpired = sp.TimeoutExpired
 
         assert check_ffmpeg_available() is False
 
-    @patch("audiobook_ripper.services.encoder.subprocess")
-    def test_ffmpeg_timeout(self, mock_subprocess):
+    def test_ffmpeg_timeout(self, patch_subprocess):
         """Test handling of FFmpeg timeout."""
         import subprocess
+        mock_subprocess = patch_subprocess("encoder")
         mock_subprocess.run.side_effect = subprocess.TimeoutExpired("ffmpeg", 10)
-        mock_subprocess.TimeoutExpired = subprocess.TimeoutExpired
 
         assert check_ffmpeg_available() is False
@@ -0,0 +1,71 @@
+"""Tests for the shared ffprobe helper."""
+
+from audiobook_ripper.services import ffprobe
+
+
+class TestProbe:
+    """Tests for ffprobe.probe and probe_disc."""
+
+    def test_probe_parses_duration_and_chapters(self, patch_subprocess, tmp_path, run_result):
+        """Test that one ffprobe call yields both duration and chapters."""
+        file_path = tmp_path / "test.wav"
+        file_path.write_bytes(b"RIFF" + b"\x00" * 100)
+
+        mock_subprocess = patch_subprocess("ffprobe")
+        mock_subprocess.run.return_value = run_result(
+            returncode=0,
+            stdout=(
+                '{"format": {"duration": "300.5"},'
+                ' "chapters": [{"id": 0, "start_time": "0", "end_time": "300.5"}]}'
+            ),
+        )
+
+        result = ffprobe.probe(file_path)
+
+        assert result.duration == 300.5
+        assert len(result.chapters) == 1
+        mock_subprocess.run.assert_called_once()
+
+    def test_probe_caches_by_mtime_and_size(self, patch_subprocess, tmp_path, run_result):
+        """Test that an unchanged file is only probed once."""
+        file_path = tmp_path / "cached.wav"
+        file_path.write_bytes(b"RIFF" + b"\x00" * 100)
+
+        mock_subprocess = patch_subprocess("ffprobe")
+        mock_subprocess.run.return_value = run_result(
+            returncode=0,
+            stdout='{"format": {"duration": "10.0"}, "chapters": []}',
+        )
+
+        first = ffprobe.probe(file_path)
+        second = ffprobe.probe(file_path)
+
+        assert first.duration == second.duration == 10.0
+        assert mock_subprocess.run.call_count == 1
+
+    def test_probe_failure_returns_empty_result(self, patch_subprocess, tmp_path, run_result):
+        """Test that probe failures yield an empty ProbeResult."""
+        file_path = tmp_path / "bad.wav"
+        file_path.write_bytes(b"\x00" * 10)
+
+        mock_subprocess = patch_subprocess("ffprobe")
+        mock_subprocess.run.return_value = run_result(returncode=1, stdout="")
+
+        result = ffprobe.probe(file_path)
+
+        assert result.duration == 0.0
+        assert result.chapters == []
+
+    def test_probe_disc_uses_libcdio(self, patch_subprocess, run_result):
+        """Test that probe_disc probes the drive via the libcdio demuxer."""
+        mock_subprocess = patch_subprocess("ffprobe")
+        mock_subprocess.run.return_value = run_result(
+            returncode=0,
+            stdout='{"format": {}, "chapters": []}',
+        )
+
+        ffprobe.probe_disc("D")
+
+        cmd = mock_subprocess.run.call_args[0][0]
+        assert "libcdio" in cmd
+        assert "D:" in cmd
@@ -10,19 +10,26 @@ from audiobook_ripper.core.models import (
     Track,
 )
 
+# Default-constructed instances shared by the default-value tests;
+# treat as read-only.
+_DEFAULT_META = AudiobookMetadata()
+_DEFAULT_TRACK = Track(number=1, duration_seconds=100)
+
 
 class TestDriveInfo:
     """Tests for DriveInfo model."""
 
-    def test_str_with_disc(self):
-        """Test string representation with disc present."""
-        drive = DriveInfo(letter="D", name="DVD Drive", has_disc=True)
-        assert str(drive) == "D: DVD Drive (Ready)"
-
-    def test_str_without_disc(self):
-        """Test string representation without disc."""
-        drive = DriveInfo(letter="E", name="BD Drive", has_disc=False)
-        assert str(drive) == "E: BD Drive (Empty)"
+    @pytest.mark.parametrize("drive, expected", [
+        pytest.param(
+            DriveInfo(letter="D", name="DVD Drive", has_disc=True),
+            "D: DVD Drive (Ready)", id="with-disc"),
+        pytest.param(
+            DriveInfo(letter="E", name="BD Drive", has_disc=False),
+            "E: BD Drive (Empty)", id="without-disc"),
+    ])
+    def test_str(self, drive, expected):
+        """Test string representation with and without a disc."""
+        assert str(drive) == expected
 
 
 class TestTrack:
@@ -45,9 +52,8 @@ class TestTrack:
 
     def test_default_values(self):
         """Test default values for optional fields."""
-        track = Track(number=1, duration_seconds=100)
-        assert track.title == ""
-        assert track.artist == ""
+        assert _DEFAULT_TRACK.title == ""
+        assert _DEFAULT_TRACK.artist == ""
 
 
 class TestAudiobookMetadata:
@@ -55,75 +61,47 @@ class TestAudiobookMetadata:
 
     def test_default_values(self):
         """Test default values."""
-        meta = AudiobookMetadata()
-        assert meta.genre == "Audiobook"
-        assert meta.cover_art is None
-        assert meta.year is None
-
-    def test_to_id3_tags_basic(self):
-        """Test ID3 tag conversion with basic fields."""
-        meta = AudiobookMetadata(
-            title="Test Title",
-            artist="Test Author",
-            album="Test Album",
-            track_number=5,
-            total_tracks=10,
-        )
-        tags = meta.to_id3_tags()
-
-        assert tags["TIT2"] == "Test Title"
-        assert tags["TPE1"] == "Test Author"
-        assert tags["TALB"] == "Test Album"
-        assert tags["TRCK"] == "5/10"
-        assert tags["TCON"] == "Audiobook"
-
-    def test_to_id3_tags_with_year(self):
-        """Test ID3 tag conversion with year."""
-        meta = AudiobookMetadata(year=2024)
-        tags = meta.to_id3_tags()
-        assert tags["TDRC"] == "2024"
-
-    def test_to_id3_tags_with_narrator(self):
-        """Test ID3 tag conversion with narrator."""
-        meta = AudiobookMetadata(narrator="John Smith")
-        tags = meta.to_id3_tags()
-        assert tags["TPE2"] == "John Smith"
-
-    def test_to_id3_tags_with_series(self):
-        """Test ID3 tag conversion with series info."""
-        meta = AudiobookMetadata(series="My Series", series_number="3")
-        tags = meta.to_id3_tags()
-        assert tags["TIT1"] == "My Series #3"
-
-    def test_to_id3_tags_track_without_total(self):
-        """Test ID3 tag conversion without total tracks."""
-        meta = AudiobookMetadata(track_number=5, total_tracks=0)
-        tags = meta.to_id3_tags()
-        assert tags["TRCK"] == "5"
+        assert _DEFAULT_META.genre == "Audiobook"
+        assert _DEFAULT_META.cover_art is None
+        assert _DEFAULT_META.year is None
+
+    @pytest.mark.parametrize("kwargs, expected", [
+        pytest.param(
+            {"title": "Test Title", "artist": "Test Author",
+             "album": "Test Album", "track_number": 5, "total_tracks": 10},
+            {"TIT2": "Test Title", "TPE1": "Test Author",
+             "TALB": "Test Album", "TRCK": "5/10", "TCON": "Audiobook"},
+            id="basic"),
+        pytest.param({"year": 2024}, {"TDRC": "2024"}, id="year"),
+        pytest.param({"narrator": "John Smith"}, {"TPE2": "John Smith"},
+                     id="narrator"),
+        pytest.param({"series": "My Series", "series_number": "3"},
+                     {"TIT1": "My Series #3"}, id="series"),
+        pytest.param({"track_number": 5, "total_tracks": 0}, {"TRCK": "5"},
+                     id="track-without-total"),
+    ])
+    def test_to_id3_tags(self, kwargs, expected):
+        """Test ID3 tag conversion for each field group."""
+        tags = AudiobookMetadata(**kwargs).to_id3_tags()
+
+        assert expected.items() <= tags.items()
 
 
 class TestRipProgress:
     """Tests for RipProgress model."""
 
-    def test_overall_progress_empty(self):
-        """Test overall progress with zero tracks."""
-        progress = RipProgress(track_number=1, total_tracks=0, track_progress=0.5)
-        assert progress.overall_progress == 0.0
-
-    def test_overall_progress_first_track(self):
-        """Test overall progress on first track."""
-        progress = RipProgress(track_number=1, total_tracks=4, track_progress=0.5)
-        # (0 completed + 0.5 current) / 4 = 0.125
-        assert progress.overall_progress == 0.125
-
-    def test_overall_progress_middle_track(self):
-        """Test overall progress in middle of ripping."""
-        progress = RipProgress(track_number=3, total_tracks=4, track_progress=0.5)
-        # (2 completed + 0.5 current) / 4 = 0.625
-        assert progress.overall_progress == 0.625
-
-    def test_overall_progress_complete(self):
-        """Test overall progress when complete."""
-        progress = RipProgress(track_number=4, total_tracks=4, track_progress=1.0)
-        # (3 completed + 1.0 current) / 4 = 1.0
-        assert progress.overall_progress == 1.0
+    # Expected values are (completed tracks + current progress) / total
+    @pytest.mark.parametrize("track_number, total_tracks, track_progress, expected", [
+        pytest.param(1, 0, 0.5, 0.0, id="empty"),
+        pytest.param(1, 4, 0.5, 0.125, id="first-track"),
+        pytest.param(3, 4, 0.5, 0.625, id="middle-track"),
+        pytest.param(4, 4, 1.0, 1.0, id="complete"),
+    ])
+    def test_overall_progress(self, track_number, total_tracks, track_progress, expected):
+        """Test overall progress across the rip lifecycle."""
+        progress = RipProgress(
+            track_number=track_number,
+            total_tracks=total_tracks,
+            track_progress=track_progress,
+        )
+        assert progress.overall_progress == expected
@@ -1,52 +1,94 @@
 """Tests for the MusicBrainz service."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from dataclasses import replace
+from unittest.mock import Mock
 
+import audiobook_ripper.services.musicbrainz as musicbrainz_module
 from audiobook_ripper.services.musicbrainz import MusicBrainzService
 from audiobook_ripper.core.models import AudiobookMetadata, Track
 
+# Shared test data; treat as read-only. apply_to_tracks never mutates
+# its inputs, so the Track instances can be reused as-is.
+_TWO_TRACKS = (
+    Track(number=1, duration_seconds=180),
+    Track(number=2, duration_seconds=240),
+)
+
+# Canned web-service responses shared across tests; treat as read-only.
+_DISC_RESPONSE = {
+    "disc": {
+        "release-list": [{
+            "title": "Test Album",
+            "date": "2024-01-15",
+            "artist-credit": [{"artist": {"name": "Test Artist"}}],
+            "medium-list": [{
+                "track-list": [
+                    {
+                        "number": "1",
+                        "recording": {"title": "Track 1", "length": 180000}
+                    },
+                    {
+                        "number": "2",
+                        "recording": {"title": "Track 2", "length": 240000}
+                    },
+                ]
+            }]
+        }]
+    }
+}
+_SEARCH_RESPONSE = {
+    "release-list": [
+        {
+            "title": "Result 1",
+            "artist-credit": [{"artist": {"name": "Artist 1"}}],
+            "medium-list": []
+        },
+        {
+            "title": "Result 2",
+            "artist-credit": [{"artist": {"name": "Artist 2"}}],
+            "medium-list": []
+        },
+    ]
+}
+_MULTI_ARTIST_RESPONSE = {
+    "disc": {
+        "release-list": [{
+            "title": "Collaboration",
+            "artist-credit": [
+                {"artist": {"name": "Artist A"}},
+                {"artist": {"name": "Artist B"}},
+            ],
+            "medium-list": []
+        }]
+    }
+}
+
 
 class TestMusicBrainzService:
     """Tests for MusicBrainzService."""
 
+    @pytest.fixture(autouse=True)
+    def mock_mb(self, monkeypatch):
+        """Swap the module's musicbrainzngs for a Mock in every test."""
+        mock = Mock()
+        monkeypatch.setattr(musicbrainz_module, "musicbrainzngs", mock)
+        return mock
+
     @pytest.fixture
-    def service(self):
-        """Create a MusicBrainzService instance."""
-        with patch("audiobook_ripper.services.musicbrainz.musicbrainzngs"):
-            return MusicBrainzService()
+    def service(self, tmp_path):
+        """Create a MusicBrainzService instance with an isolated cache."""
+        return MusicBrainzService(cache_path=tmp_path / "mb_cache.json")
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_init_sets_useragent(self, mock_mb):
         """Test that initialization sets user agent."""
         MusicBrainzService("TestApp", "1.0.0")
 
         mock_mb.set_useragent.assert_called_once_with("TestApp", "1.0.0")
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_lookup_by_disc_id_success(self, mock_mb, service):
         """Test successful disc ID lookup."""
-        mock_mb.get_releases_by_discid.return_value = {
-            "disc": {
-                "release-list": [{
-                    "title": "Test Album",
-                    "date": "2024-01-15",
-                    "artist-credit": [{"artist": {"name": "Test Artist"}}],
-                    "medium-list": [{
-                        "track-list": [
-                            {
-                                "number": "1",
-                                "recording": {"title": "Track 1", "length": 180000}
-                            },
-                            {
-                                "number": "2",
-                                "recording": {"title": "Track 2", "length": 240000}
-                            },
-                        ]
-                    }]
-                }]
-            }
-        }
+        mock_mb.get_releases_by_discid.return_value = _DISC_RESPONSE
 
         result = service.lookup_by_disc_id("test_disc_id")
 
@@ -57,7 +99,6 @@ class TestMusicBrainzService:
         assert len(result["tracks"]) == 2
         assert result["tracks"][0]["title"] == "Track 1"
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_lookup_by_disc_id_not_found(self, mock_mb, service):
         """Test disc ID lookup when not found."""
         mock_mb.get_releases_by_discid.return_value = {}
@@ -66,7 +107,6 @@ class TestMusicBrainzService:
 
         assert result is None
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_lookup_by_disc_id_network_error(self, mock_mb, service):
         """Test handling of network errors."""
         mock_mb.WebServiceError = Exception
@@ -76,23 +116,41 @@ class TestMusicBrainzService:
 
         assert result is None
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
+    def test_lookup_by_disc_id_uses_cache(self, mock_mb, tmp_path):
+        """Test that a second lookup for the same disc skips the web service."""
+        mock_mb.get_releases_by_discid.return_value = {
+            "disc": {
+                "release-list": [{"title": "Cached Album", "medium-list": []}]
+            }
+        }
+
+        cache_path = tmp_path / "mb_cache.json"
+        service = MusicBrainzService(cache_path=cache_path)
+
+        first = service.lookup_by_disc_id("cached_disc_id")
+        second = service.lookup_by_disc_id("cached_disc_id")
+
+        assert first["title"] == "Cached Album"
+        assert second == first
+        assert mock_mb.get_releases_by_discid.call_count == 1
+
+        # The cache persists across service instances
+        fresh = MusicBrainzService(cache_path=cache_path)
+        assert fresh.lookup_by_disc_id("cached_disc_id")["title"] == "Cached Album"
+        assert mock_mb.get_releases_by_discid.call_count == 1
+
+    def test_lookup_by_disc_id_refresh_bypasses_cache(self, mock_mb, service):
+        """Test that refresh=True re-queries MusicBrainz."""
+        mock_mb.get_releases_by_discid.return_value = {}
+
+        service.lookup_by_disc_id("refresh_disc_id")
+        service.lookup_by_disc_id("refresh_disc_id", refresh=True)
+
+        assert mock_mb.get_releases_by_discid.call_count == 2
+
     def test_search_release_success(self, mock_mb, service):
         """Test successful release search."""
-        mock_mb.search_releases.return_value = {
-            "release-list": [
-                {
-                    "title": "Result 1",
-                    "artist-credit": [{"artist": {"name": "Artist 1"}}],
-                    "medium-list": []
-                },
-                {
-                    "title": "Result 2",
-                    "artist-credit": [{"artist": {"name": "Artist 2"}}],
-                    "medium-list": []
-                },
-            ]
-        }
+        mock_mb.search_releases.return_value = _SEARCH_RESPONSE
 
         results = service.search_release("test query")
 
@@ -100,7 +158,6 @@ class TestMusicBrainzService:
         assert results[0]["title"] == "Result 1"
         assert results[1]["title"] == "Result 2"
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_search_release_empty(self, mock_mb, service):
         """Test search with no results."""
         mock_mb.search_releases.return_value = {"release-list": []}
@@ -109,7 +166,25 @@ class TestMusicBrainzService:
 
         assert results == []
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
+    def test_search_release_uses_cache(self, mock_mb, service):
+        """Test that repeated searches are served from the cache."""
+        mock_mb.search_releases.return_value = {
+            "release-list": [
+                {
+                    "title": "Cached Result",
+                    "artist-credit": [{"artist": {"name": "Artist"}}],
+                    "medium-list": []
+                },
+            ]
+        }
+
+        first = service.search_release("cached query")
+        second = service.search_release("cached query")
+
+        assert first == second
+        assert first[0]["title"] == "Cached Result"
+        mock_mb.search_releases.assert_called_once()
+
     def test_search_release_network_error(self, mock_mb, service):
         """Test handling of network errors in search."""
         mock_mb.WebServiceError = Exception
@@ -131,12 +206,7 @@ class TestMusicBrainzService:
             ]
         }
 
-        tracks = [
-            Track(number=1, duration_seconds=180),
-            Track(number=2, duration_seconds=240),
-        ]
-
-        result = service.apply_to_tracks(release_info, tracks)
+        result = service.apply_to_tracks(release_info, list(_TWO_TRACKS))
 
         assert len(result) == 2
         assert result[1].album == "Test Book"
@@ -154,30 +224,16 @@ class TestMusicBrainzService:
             "tracks": []  # No track info
         }
 
-        tracks = [
-            Track(number=1, duration_seconds=180, title="Original Title"),
-        ]
+        tracks = [replace(_TWO_TRACKS[0], title="Original Title")]
 
         result = service.apply_to_tracks(release_info, tracks)
 
         # Should keep original title when not in release info
         assert result[1].title == "Original Title"
 
-    @patch("audiobook_ripper.services.musicbrainz.musicbrainzngs")
     def test_parse_release_multiple_artists(self, mock_mb, service):
         """Test parsing release with multiple artists."""
-        mock_mb.get_releases_by_discid.return_value = {
-            "disc": {
-                "release-list": [{
-                    "title": "Collaboration",
-                    "artist-credit": [
-                        {"artist": {"name": "Artist A"}},
-                        {"artist": {"name": "Artist B"}},
-                    ],
-                    "medium-list": []
-                }]
-            }
-        }
+        mock_mb.get_releases_by_discid.return_value = _MULTI_ARTIST_RESPONSE
 
         result = service.lookup_by_disc_id("test_disc_id")
 
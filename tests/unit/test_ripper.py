@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 from audiobook_ripper.services.ripper import FFmpegRipper
 
@@ -15,66 +15,111 @@ class TestFFmpegRipper:
         """Create a FFmpegRipper instance."""
         return FFmpegRipper()
 
-    @patch("audiobook_ripper.services.ripper.subprocess")
-    def test_rip_track_success(self, mock_subprocess, ripper, tmp_path):
-        """Test successful track ripping."""
-        output_path = tmp_path / "track01.wav"
-
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = ("", "")
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def rip_dir(tmp_path_factory):
+        """Shared output directory for tests whose subprocess is mocked.
+
+        No real audio is written, so per-test tmp_path directories are
+        overhead; tests use distinct filenames within this one.
+        """
+        return tmp_path_factory.mktemp("rip")
+
+    @pytest.mark.parametrize("returncode, stderr, error", [
+        pytest.param(0, b"", None, id="success"),
+        pytest.param(1, b"Error: No disc", "FFmpeg failed", id="failure"),
+    ])
+    def test_rip_track(self, patch_subprocess, ripper, tmp_path,
+                       returncode, stderr, error):
+        """Test rip_track outcomes and parent-directory creation."""
+        output_path = tmp_path / "subdir" / "track01.wav"
+        ripper._chapter_cache["D"] = [{"start_time": 0.0, "end_time": 180.0}]
+
+        mock_subprocess = patch_subprocess("ripper")
+        mock_process = Mock()
+        mock_process.returncode = returncode
+        mock_process.communicate.return_value = (b"", stderr)
         mock_subprocess.Popen.return_value = mock_process
 
-        progress_values = []
-        ripper.rip_track("D", 1, output_path, lambda p: progress_values.append(p))
-
-        assert mock_subprocess.Popen.called
-        assert 1.0 in progress_values
+        if error is None:
+            progress_values = []
+            ripper.rip_track("D", 1, output_path, lambda p: progress_values.append(p))
+            assert mock_subprocess.Popen.called
+            assert 1.0 in progress_values
+        else:
+            with pytest.raises(RuntimeError) as exc_info:
+                ripper.rip_track("D", 1, output_path)
+            assert error in str(exc_info.value)
+
+        # Missing parent directories are created either way
+        assert output_path.parent.exists()
 
-    @patch("audiobook_ripper.services.ripper.subprocess")
-    def test_rip_track_failure(self, mock_subprocess, ripper, tmp_path):
-        """Test handling of ripping failure."""
-        output_path = tmp_path / "track01.wav"
+    def test_rip_and_encode_single_process(self, patch_subprocess, ripper, rip_dir):
+        """Test that rip_and_encode fuses rip and encode into one ffmpeg."""
+        output_path = rip_dir / "rip_and_encode.mp3"
+        ripper._chapter_cache["D"] = [{"start_time": 0.0, "end_time": 180.0}]
 
+        mock_subprocess = patch_subprocess("ripper")
         mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = ("", "Error: No disc")
+        mock_process.returncode = 0
+        mock_process.stdout.__iter__ = Mock(return_value=iter([
+            "out_time_ms=90000000\n",
+        ]))
         mock_subprocess.Popen.return_value = mock_process
 
-        with pytest.raises(RuntimeError) as exc_info:
-            ripper.rip_track("D", 1, output_path)
+        progress_values = []
+        ripper.rip_and_encode("D", 1, output_path, progress_callback=lambda p: progress_values.append(p))
 
-        assert "FFmpeg failed" in str(exc_info.value)
+        cmd = mock_subprocess.Popen.call_args[0][0]
+        assert "libcdio" in cmd
+        assert "libmp3lame" in cmd
+        assert mock_subprocess.Popen.call_count == 1
+        assert 1.0 in progress_values
 
-    @patch("audiobook_ripper.services.ripper.subprocess")
-    def test_rip_track_creates_parent_dir(self, mock_subprocess, ripper, tmp_path):
-        """Test that parent directories are created."""
-        output_path = tmp_path / "subdir" / "deep" / "track01.wav"
+    def test_rip_and_encode_disc_single_process(self, patch_subprocess, ripper, rip_dir):
+        """Test that rip_and_encode_disc fuses the full-disc rip and encode."""
+        output_path = rip_dir / "book.mp3"
+        output_path.write_bytes(b"")
 
-        mock_process = MagicMock()
+        mock_subprocess = patch_subprocess("ripper")
+        mock_process = Mock()
         mock_process.returncode = 0
-        mock_process.communicate.return_value = ("", "")
+        mock_process.stdout.read.side_effect = [b"out_time_ms=90000000\n", b""]
         mock_subprocess.Popen.return_value = mock_process
 
-        ripper.rip_track("D", 1, output_path)
+        progress_values = []
+        ripper.rip_and_encode_disc(
+            "D", output_path, total_duration=3600.0,
+            progress_callback=lambda p: progress_values.append(p),
+        )
+
+        cmd = mock_subprocess.Popen.call_args[0][0]
+        assert "libcdio" in cmd
+        assert "libmp3lame" in cmd
+        assert mock_subprocess.Popen.call_count == 1
+        assert 1.0 in progress_values
 
-        assert output_path.parent.exists()
+    def test_get_chapters_persists_by_disc_id(self, tmp_path):
+        """Test that chapters cached by disc ID survive new instances."""
+        chapters = [{"start_time": 0.0, "end_time": 180.0}]
+        ripper = FFmpegRipper(cache_dir=tmp_path)
+        ripper._save_chapter_file("disc123", chapters)
 
-    @patch("audiobook_ripper.services.ripper.subprocess")
-    def test_cancel_terminates_process(self, mock_subprocess, ripper):
-        """Test that cancel terminates the running process."""
-        mock_process = MagicMock()
-        mock_subprocess.Popen.return_value = mock_process
+        fresh = FFmpegRipper(cache_dir=tmp_path)
 
-        # Simulate a running process
-        ripper._process = mock_process
-        ripper.cancel()
+        assert fresh.get_chapters("D", disc_id="disc123") == chapters
 
-        mock_process.terminate.assert_called_once()
-        mock_process.wait.assert_called()
+    @pytest.mark.parametrize("has_process", [True, False], ids=["running", "idle"])
+    def test_cancel(self, ripper, has_process):
+        """Test cancel with and without a running process."""
+        mock_process = Mock()
+        if has_process:
+            # Simulate a running process
+            ripper._process = mock_process
 
-    def test_cancel_no_process(self, ripper):
-        """Test cancel when no process is running."""
-        # Should not raise
         ripper.cancel()
+
         assert ripper._cancelled is True
+        if has_process:
+            mock_process.terminate.assert_called_once()
+            mock_process.wait.assert_called()